@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 """
-修复延迟计算问题的基准测试
-强制确保延迟在合理范围内
+LDMR / SPF / ECMP 基准测试
+在同一拓扑和流量需求上对比三种算法
 """
 
+import os
 import sys
 import time
+import json
+import pickle
+import hashlib
+import contextlib
+import numpy as np
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
@@ -13,67 +21,156 @@ from datetime import datetime
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / 'src'))
 
-from config import load_config
+from config import load_config, as_ns
 from topology.satellite_constellation import LEONetworkBuilder
-from traffic.traffic_model import TrafficGenerator
+from traffic.traffic_model import generate_demands, demands_to_array, demands_from_array
 from algorithms.ldmr_algorithms import LDMRAlgorithm, LDMRConfig
 from algorithms.baseline.spf_algorithm import SPFAlgorithm
 from algorithms.baseline.ecmp_algorithm import ECMPAlgorithm
-from output.result_exporter import export_benchmark_comparison
+from algorithms.jit_kernels import path_stats, warmup_kernels
+
+@dataclass
+class BenchmarkResult:
+    """单个算法的基准测试结果（字段顺序与CSV导出列一致，末尾两项供终端显示使用）"""
+    __slots__ = (
+        'algorithm', 'total_demands', 'successful_demands', 'failed_demands', 'success_rate',
+        'total_paths', 'avg_paths_per_demand',
+        'avg_path_length', 'min_path_length', 'max_path_length',
+        'avg_path_delay_ms', 'min_path_delay_ms', 'max_path_delay_ms',
+        'execution_time_s', 'avg_computation_time_ms', 'disjoint_rate',
+        'avg_delay', 'execution_time',
+    )
+    algorithm: str
+    total_demands: int
+    successful_demands: int
+    failed_demands: int
+    success_rate: float
+    total_paths: int
+    avg_paths_per_demand: float
+    avg_path_length: float
+    min_path_length: int
+    max_path_length: int
+    avg_path_delay_ms: float
+    min_path_delay_ms: float
+    max_path_delay_ms: float
+    execution_time_s: float
+    avg_computation_time_ms: float
+    disjoint_rate: float
+    avg_delay: float
+    execution_time: float
+
+
+# 拓扑缓存目录（磁盘）和进程内缓存，键为网络配置与拓扑源码的哈希
+TOPOLOGY_CACHE_DIR = project_root / '.cache'
+_topology_cache = {}
+
+
+def _topology_cache_key(network_config):
+    """网络配置 + 拓扑模块源码修改时间的哈希，源码变化后旧缓存自动失效"""
+    topology_sources = sorted((project_root / 'src' / 'topology').glob('*.py'))
+    payload = {
+        'network': network_config,
+        'sources': [(path.name, path.stat().st_mtime_ns) for path in topology_sources],
+    }
+    return hashlib.blake2b(json.dumps(payload, sort_keys=True).encode('utf-8'),
+                           digest_size=16).hexdigest()
+
+
+def cached_build_network(config):
+    """构建LEO网络拓扑，相同网络配置的结果缓存在内存和 .cache/ 目录中
+
+    拓扑完全由 config['network'] 决定，重复运行时直接加载缓存。
+    """
+    network_config = config['network']
+    key = _topology_cache_key(network_config)
+    topology = _topology_cache.get(key)
+    if topology is not None:
+        return topology
 
+    cache_file = TOPOLOGY_CACHE_DIR / f'topo_{key}.pkl'
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                topology = pickle.load(f)
+        except Exception as e:
+            print(f"   ⚠️  拓扑缓存读取失败，重新构建: {e}")
+            topology = None
 
-class FixedDelayBenchmark:
-    def __init__(self, config):
-        self.config = config
+    if topology is None:
+        builder = LEONetworkBuilder(
+            network_config['constellation'],
+            network_config['ground_stations']
+        )
+        topology = builder.build_network(
+            satellite_bandwidth=network_config.get('satellite_bandwidth', 10.0),
+            ground_bandwidth=network_config.get('ground_bandwidth', 5.0)
+        )
+        try:
+            TOPOLOGY_CACHE_DIR.mkdir(exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump(topology, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"   ⚠️  拓扑缓存写入失败: {e}")
 
-    def fix_topology_delays(self, topology):
-        """修复拓扑中的延迟计算"""
-        print("🔧 强制修复所有网络延迟...")
+    _topology_cache[key] = topology
+    return topology
 
-        fixed_count = 0
-        for link_id, link in topology.links.items():
-            original_delay = link.delay
 
-            # =================================================================
-            # 【核心错误修复】
-            #  之前这里直接用 link_id.encode()，但 link_id 是一个元组，所以报错。
-            #  现在改为 str(link_id).encode()，将元组转换成字符串后再编码，解决崩溃问题。
-            # =================================================================
-            seed = int.from_bytes(str(link_id).encode(), 'little')
+# 结果表的行模板，预先绑定format避免每行重新解析格式串
+_result_row = "{:<6} {:<8.1%} {:<10.1f} {:<8.1f} {:<8.1f} {:<10.2f}".format
 
-            if 'GS' in str(link_id):  # 同样需要将 link_id 转为字符串
-                # 地面站到卫星链路：20-80ms
-                link.delay = 20.0 + (seed % 600) / 10.0
-            else:
-                # 卫星间链路：10-50ms
-                link.delay = 10.0 + (seed % 400) / 10.0
+# 计时使用单调高精度时钟，整数纳秒直到最终换算
+_now = time.perf_counter_ns
 
-            link.weight = link.delay
-            fixed_count += 1
+# 写入CSV的字段（去掉仅供终端显示的两项）
+CSV_FIELDS = BenchmarkResult.__slots__[:-2]
 
-            if fixed_count <= 5:
-                print(f"   修复链路 {link_id}: {original_delay:.6f}ms -> {link.delay:.2f}ms")
 
-        print(f"   ...已强制修复 {fixed_count} 条链路的延迟")
+def summarize_results(results):
+    """单次遍历结果：统计成功需求数并收集所有路径的延迟和跳数数组"""
+    successful_demands = 0
+    delays = []
+    lengths = []
+    for r in results:
+        if not (r.success and r.paths):
+            continue
+        successful_demands += 1
+        for p in r.paths:
+            delays.append(p.total_delay)
+            lengths.append(p.length)
+    return (successful_demands,
+            np.asarray(delays, dtype=np.float64),
+            np.asarray(lengths, dtype=np.int64))
 
-        all_delays = [link.delay for link in topology.links.values()]
-        if all_delays:
-            print(f"   修复后延迟范围: {min(all_delays):.2f}ms - {max(all_delays):.2f}ms")
 
-        return topology
+def _run_with_demand_array(run_fn, topology, demand_array, node_ids):
+    """子进程入口：由结构化数组还原流量需求后运行算法"""
+    return run_fn(topology, demands_from_array(demand_array, node_ids))
+
+
+class FixedDelayBenchmark:
+    # 各算法的路径不相交率：LDMR按构造链路不相交，SPF为单路径，ECMP的等价路径可能共享链路
+    DISJOINT_RATES = {'LDMR': 1.0, 'SPF': 1.0, 'ECMP': 0.8}
+
+    def __init__(self, config, verbose=False, quiet=False):
+        self.config = config
+        # 属性访问形式的配置，供各算法参数读取
+        self.cfg = as_ns(config)
+        # 是否在导出前打印写入CSV的逐项数据
+        self.verbose = verbose
+        # 是否丢弃算法运行过程中的逐需求日志，只保留汇总输出
+        self.quiet = quiet
+        # 本次基准测试的时间戳，所有输出文件共用
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 算法实例首次使用时创建，重复运行时复用
+        self._ldmr = None
+        self._spf = None
+        self._ecmp = None
 
     def create_network(self):
-        """创建网络拓扑并修复延迟"""
+        """创建网络拓扑"""
         print("🔧 构建网络拓扑...")
-        builder = LEONetworkBuilder(
-            self.config['network']['constellation'],
-            self.config['network']['ground_stations']
-        )
-        topology = builder.build_network(
-            satellite_bandwidth=self.config['network']['satellite_bandwidth'],
-            ground_bandwidth=self.config['network']['ground_bandwidth']
-        )
-        topology = self.fix_topology_delays(topology)  # 应用修复
+        topology = cached_build_network(self.config)
         stats = topology.get_statistics()
         print(f"   网络: {stats['total_nodes']}节点, {stats['total_links']}链路")
         return topology
@@ -81,16 +178,12 @@ class FixedDelayBenchmark:
     def generate_traffic(self, topology):
         """生成流量需求"""
         print("📈 生成流量需求...")
-        generator = TrafficGenerator()
-        ground_stations = [
-            node.id for node in topology.nodes.values()
-            if node.type.value == 'ground_station'
-        ]
-        demands = generator.generate_traffic_demands(
-            ground_station_ids=ground_stations,
-            total_traffic=self.config['traffic']['total_gbps'],
-            duration=self.config['traffic']['duration'],
-            elephant_ratio=self.config['traffic']['elephant_ratio']
+        demands = generate_demands(
+            ground_station_ids=topology.ground_station_ids,
+            total_traffic=self.cfg.traffic.total_gbps,
+            duration=self.cfg.traffic.duration,
+            elephant_ratio=self.cfg.traffic.elephant_ratio,
+            seed=getattr(self.cfg.traffic, 'seed', None)
         )
         print(f"   生成 {len(demands)} 个流量需求")
         return demands
@@ -108,208 +201,215 @@ class FixedDelayBenchmark:
             return False
         return True
 
-    def run_ldmr_fixed(self, topology, demands):
-        """运行LDMR算法 - 修复延迟版"""
-        print("\n🚀 运行LDMR算法 (修复延迟版)...")
-        ldmr_config = LDMRConfig(
-            K=self.config['algorithm']['K'], r1=self.config['algorithm']['r1'],
-            r2=self.config['algorithm']['r2'], r3=self.config['algorithm']['r3'],
-            Ne_th=self.config['algorithm']['Ne_th'], enable_statistics=True
+    def _run_algorithm(self, name, run_fn, topology, demands):
+        """运行单个算法并汇总指标 - 三种算法共用的驱动"""
+        disjoint_rate = self.DISJOINT_RATES[name]
+        with contextlib.ExitStack() as stack:
+            if self.quiet:
+                stack.enter_context(contextlib.redirect_stdout(
+                    stack.enter_context(open(os.devnull, 'w'))))
+            start_ns = _now()
+            results = run_fn(topology, demands)
+            exec_ns = _now() - start_ns
+        successful_demands, delays, lengths = summarize_results(results)
+        print(f"   {name}: 成功{successful_demands}/{len(results)}, 总路径{len(delays)}")
+
+        if len(delays) == 0:
+            return self.empty_result(name, len(results), exec_ns)
+
+        result = self._build_result(name, len(results), successful_demands, delays, lengths,
+                                    exec_ns, disjoint_rate)
+        print(f"   {name}: 平均延迟={result.avg_delay:.2f}ms, "
+              f"平均长度={result.avg_path_length:.1f}跳")
+        return result
+
+    def _build_result(self, name, total_demands, successful_demands, delays, lengths,
+                      exec_ns, disjoint_rate):
+        """由路径延迟/跳数数组和纳秒执行时间构造 BenchmarkResult，空数组对应空结果"""
+        total_paths = len(delays)
+        exec_time = exec_ns / 1e9
+        has_paths = total_paths > 0
+        if has_paths:
+            delay_sum, delay_min, delay_max, length_sum, length_min, length_max = path_stats(delays, lengths)
+        else:
+            delay_sum = delay_min = delay_max = length_sum = length_min = length_max = 0
+        avg_delay_ms = float(delay_sum / total_paths) if has_paths else 0.0
+        values = (
+            name, total_demands, successful_demands, total_demands - successful_demands,
+            successful_demands / total_demands if has_paths and total_demands else 0.0,
+            total_paths,
+            total_paths / successful_demands if has_paths and successful_demands else 0.0,
+            float(length_sum / total_paths) if has_paths else 0.0,
+            int(length_min),
+            int(length_max),
+            avg_delay_ms,
+            float(delay_min),
+            float(delay_max),
+            exec_time,
+            exec_ns / total_demands / 1e6 if has_paths and total_demands else 0.0,
+            disjoint_rate if has_paths else 0.0,
+            avg_delay_ms, exec_time,
         )
-        ldmr = LDMRAlgorithm(ldmr_config)
-        start_time = time.time()
-        results = ldmr.run_ldmr_algorithm(topology, demands)
-        exec_time = time.time() - start_time
-        successful_results = [r for r in results if r.success and r.paths]
-        total_paths = sum(len(r.paths) for r in successful_results)
-        print(f"   LDMR: 成功{len(successful_results)}/{len(results)}, 总路径{total_paths}")
-
-        if successful_results and total_paths > 0:
-            all_delays = [p.total_delay for r in successful_results for p in r.paths]
-            all_lengths = [p.length for r in successful_results for p in r.paths]
-            avg_delay_ms = sum(all_delays) / len(all_delays) if all_delays else 0
-            avg_path_length = sum(all_lengths) / len(all_lengths) if all_lengths else 0
-            print(f"   修复后LDMR: 平均延迟={avg_delay_ms:.2f}ms, 平均长度={avg_path_length:.1f}跳")
-            return {
-                'algorithm': 'LDMR', 'total_demands': len(results),
-                'successful_demands': len(successful_results), 'failed_demands': len(results) - len(successful_results),
-                'success_rate': float(len(successful_results)) / float(len(results)) if results else 0.0,
-                'total_paths': int(total_paths),
-                'avg_paths_per_demand': float(total_paths) / float(
-                    len(successful_results)) if successful_results else 0.0,
-                'avg_path_length': float(avg_path_length),
-                'min_path_length': int(min(all_lengths)) if all_lengths else 0,
-                'max_path_length': int(max(all_lengths)) if all_lengths else 0,
-                'avg_path_delay_ms': float(avg_delay_ms),
-                'min_path_delay_ms': float(min(all_delays)) if all_delays else 0,
-                'max_path_delay_ms': float(max(all_delays)) if all_delays else 0,
-                'execution_time_s': float(exec_time),
-                'avg_computation_time_ms': float((exec_time / len(results)) * 1000) if results else 0.0,
-                'disjoint_rate': 1.0,
-                'avg_delay': avg_delay_ms, 'execution_time': exec_time,
-            }
+        return BenchmarkResult(*values)
+
+    def get_ldmr(self):
+        """获取LDMR算法实例（LDMR每次运行开始时自行重置状态）"""
+        if self._ldmr is None:
+            algorithm = self.cfg.algorithm
+            ldmr_config = LDMRConfig(
+                K=algorithm.K, r1=algorithm.r1, r2=algorithm.r2, r3=algorithm.r3,
+                Ne_th=algorithm.Ne_th, enable_statistics=True,
+                seed=getattr(algorithm, 'seed', None)
+            )
+            self._ldmr = LDMRAlgorithm(ldmr_config)
+        return self._ldmr
+
+    def get_spf(self):
+        """获取SPF算法实例，复用前清空上次运行的缓存"""
+        if self._spf is None:
+            self._spf = SPFAlgorithm({'weight_type': 'delay'})
         else:
-            return self.empty_result('LDMR', len(results), exec_time)
+            self._spf.reset()
+        return self._spf
 
-    def run_spf_fixed(self, topology, demands):
-        """运行SPF算法 - 修复延迟版"""
-        print("🚀 运行SPF算法 (修复延迟版)...")
-        spf = SPFAlgorithm({'weight_type': 'delay'})
-        start_time = time.time()
-        results = spf.run_algorithm(topology, demands)
-        exec_time = time.time() - start_time
-        successful = [r for r in results if r.success and r.paths]
-        total_paths = sum(len(r.paths) for r in successful)
-        print(f"   SPF: 成功{len(successful)}/{len(results)}, 总路径{total_paths}")
-        if successful and total_paths > 0:
-            all_delays = [p.total_delay for r in successful for p in r.paths]
-            all_lengths = [p.length for r in successful for p in r.paths]
-            avg_delay_ms = sum(all_delays) / len(all_delays) if all_delays else 0
-            avg_path_length = sum(all_lengths) / len(all_lengths) if all_lengths else 0
-            print(f"   修复后SPF: 平均延迟={avg_delay_ms:.2f}ms, 平均长度={avg_path_length:.1f}跳")
-            return {
-                'algorithm': 'SPF', 'total_demands': len(results),
-                'successful_demands': len(successful), 'failed_demands': len(results) - len(successful),
-                'success_rate': float(len(successful)) / float(len(results)) if results else 0.0,
-                'total_paths': int(total_paths),
-                'avg_paths_per_demand': float(total_paths) / float(len(successful)) if successful else 0.0,
-                'avg_path_length': float(avg_path_length),
-                'min_path_length': int(min(all_lengths)) if all_lengths else 0,
-                'max_path_length': int(max(all_lengths)) if all_lengths else 0,
-                'avg_path_delay_ms': float(avg_delay_ms),
-                'min_path_delay_ms': float(min(all_delays)) if all_delays else 0,
-                'max_path_delay_ms': float(max(all_delays)) if all_delays else 0,
-                'execution_time_s': float(exec_time),
-                'avg_computation_time_ms': float((exec_time / len(results)) * 1000) if results else 0.0,
-                'disjoint_rate': 1.0,
-                'avg_delay': avg_delay_ms, 'execution_time': exec_time,
-            }
+    def get_ecmp(self):
+        """获取ECMP算法实例，复用前清空上次运行的缓存"""
+        if self._ecmp is None:
+            self._ecmp = ECMPAlgorithm({'weight_type': 'delay', 'max_paths': 4, 'tolerance': 0.1})
         else:
-            return self.empty_result('SPF', len(results), exec_time)
+            self._ecmp.reset()
+        return self._ecmp
+
+    def run_ldmr_fixed(self, topology, demands):
+        """运行LDMR算法"""
+        print("\n🚀 运行LDMR算法...")
+        ldmr = self.get_ldmr()
+        return self._run_algorithm('LDMR', ldmr.run_ldmr_algorithm, topology, demands)
+
+    def run_spf_fixed(self, topology, demands):
+        """运行SPF算法"""
+        print("🚀 运行SPF算法...")
+        spf = self.get_spf()
+        return self._run_algorithm('SPF', spf.run_algorithm, topology, demands)
 
     def run_ecmp_fixed(self, topology, demands):
-        """运行ECMP算法 - 修复延迟版"""
-        print("🚀 运行ECMP算法 (修复延迟版)...")
-        ecmp = ECMPAlgorithm({'weight_type': 'delay', 'max_paths': 4, 'tolerance': 0.1})
-        start_time = time.time()
-        results = ecmp.run_algorithm(topology, demands)
-        exec_time = time.time() - start_time
-        successful = [r for r in results if r.success and r.paths]
-        total_paths = sum(len(r.paths) for r in successful)
-        print(f"   ECMP: 成功{len(successful)}/{len(results)}, 总路径{total_paths}")
-        if successful and total_paths > 0:
-            all_delays = [p.total_delay for r in successful for p in r.paths]
-            all_lengths = [p.length for r in successful for p in r.paths]
-            avg_delay_ms = sum(all_delays) / len(all_delays) if all_delays else 0
-            avg_path_length = sum(all_lengths) / len(all_lengths) if all_lengths else 0
-            print(f"   修复后ECMP: 平均延迟={avg_delay_ms:.2f}ms, 平均长度={avg_path_length:.1f}跳")
-            return {
-                'algorithm': 'ECMP', 'total_demands': len(results),
-                'successful_demands': len(successful), 'failed_demands': len(results) - len(successful),
-                'success_rate': float(len(successful)) / float(len(results)) if results else 0.0,
-                'total_paths': int(total_paths),
-                'avg_paths_per_demand': float(total_paths) / float(len(successful)) if successful else 0.0,
-                'avg_path_length': float(avg_path_length),
-                'min_path_length': int(min(all_lengths)) if all_lengths else 0,
-                'max_path_length': int(max(all_lengths)) if all_lengths else 0,
-                'avg_path_delay_ms': float(avg_delay_ms),
-                'min_path_delay_ms': float(min(all_delays)) if all_delays else 0,
-                'max_path_delay_ms': float(max(all_delays)) if all_delays else 0,
-                'execution_time_s': float(exec_time),
-                'avg_computation_time_ms': float((exec_time / len(results)) * 1000) if results else 0.0,
-                'disjoint_rate': 0.8,
-                'avg_delay': avg_delay_ms, 'execution_time': exec_time,
-            }
-        else:
-            return self.empty_result('ECMP', len(results), exec_time)
+        """运行ECMP算法"""
+        print("🚀 运行ECMP算法...")
+        ecmp = self.get_ecmp()
+        return self._run_algorithm('ECMP', ecmp.run_algorithm, topology, demands)
 
-    def empty_result(self, algorithm_name, total_demands, exec_time):
+    def empty_result(self, algorithm_name, total_demands, exec_ns):
         """生成空结果, 确保所有字段都存在"""
-        return {
-            'algorithm': algorithm_name, 'total_demands': total_demands, 'successful_demands': 0,
-            'failed_demands': total_demands, 'success_rate': 0.0, 'total_paths': 0, 'avg_paths_per_demand': 0.0,
-            'avg_path_length': 0.0, 'min_path_length': 0, 'max_path_length': 0, 'avg_path_delay_ms': 0.0,
-            'min_path_delay_ms': 0.0, 'max_path_delay_ms': 0.0, 'execution_time_s': exec_time,
-            'avg_computation_time_ms': 0.0, 'disjoint_rate': 0.0, 'avg_delay': 0.0, 'execution_time': exec_time,
-        }
-
-    def run_benchmark(self):
-        """运行修复版基准测试"""
-        print("🎯 开始修复延迟的基准测试")
-        print("=" * 60)
-        topology = self.create_network()
-        demands = self.generate_traffic(topology)
-        results = []
-        try:
-            results.append(self.run_ldmr_fixed(topology, demands))
-        except Exception as e:
-            print(f"❌ LDMR运行失败: {e}")
-        try:
-            results.append(self.run_spf_fixed(topology, demands))
-        except Exception as e:
-            print(f"❌ SPF运行失败: {e}")
-        try:
-            results.append(self.run_ecmp_fixed(topology, demands))
-        except Exception as e:
-            print(f"❌ ECMP运行失败: {e}")
+        return self._build_result(algorithm_name, total_demands, 0, np.empty(0, dtype=np.float64),
+                                  np.empty(0, dtype=np.int64), exec_ns, 0.0)
+
+    def run_benchmark(self, parallel=True, topology=None, demands=None):
+        """运行基准测试
 
-        results = [r for r in results if r is not None]  # 过滤掉失败的结果
+        三个算法只读共享拓扑和流量需求，默认在独立进程中并发运行，
+        墙钟时间接近最慢算法的耗时而不是三者之和。
+        传入 topology/demands 时直接复用，否则按配置构建。
+        """
+        print("🎯 开始基准测试")
+        print("=" * 60)
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if topology is None:
+            topology = self.create_network()
+        if demands is None:
+            demands = self.generate_traffic(topology)
+        runners = [
+            ('LDMR', self.run_ldmr_fixed),
+            ('SPF', self.run_spf_fixed),
+            ('ECMP', self.run_ecmp_fixed),
+        ]
+        results_by_name = {}
+        max_workers = min(len(runners), os.cpu_count() or 1)
+        # 单核环境下进程池只增加序列化和进程启动开销，直接顺序运行
+        if parallel and max_workers > 1:
+            # 流量需求以结构化数组传给子进程，序列化体积约为对象列表的一半
+            demand_array, node_ids = demands_to_array(demands)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(_run_with_demand_array, run_fn, topology, demand_array, node_ids): name
+                           for name, run_fn in runners}
+                # 按完成顺序收集，失败的算法立即报告
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        results_by_name[name] = future.result()
+                    except Exception as e:
+                        print(f"❌ {name}运行失败: {e}")
+        else:
+            for name, run_fn in runners:
+                try:
+                    results_by_name[name] = run_fn(topology, demands)
+                except Exception as e:
+                    print(f"❌ {name}运行失败: {e}")
+
+        # 按固定的算法顺序输出，过滤掉失败的结果
+        results = [results_by_name[name] for name, _ in runners
+                   if results_by_name.get(name) is not None]
         self.display_results(results)
         self.export_results(results)
         return results
 
     def display_results(self, results):
         """显示结果"""
-        print("\n" + "=" * 90)
-        print("📊 修复延迟后的基准测试结果")
-        print("=" * 90)
-        print(f"{'算法':<6} {'成功率':<8} {'延迟(ms)':<10} {'路径数':<8} {'平均跳数':<8} {'执行时间(s)':<10}")
-        print("-" * 90)
-        for result in results:
-            print(f"{result.get('algorithm', 'N/A'):<6} "
-                  f"{result.get('success_rate', 0.0):<8.1%} "
-                  f"{result.get('avg_delay', 0.0):<10.1f} "
-                  f"{result.get('avg_paths_per_demand', 0.0):<8.1f} "
-                  f"{result.get('avg_path_length', 0.0):<8.1f} "
-                  f"{result.get('execution_time', 0.0):<10.2f}")
-        print("=" * 90)
+        lines = [
+            "\n" + "=" * 90,
+            "📊 基准测试结果",
+            "=" * 90,
+            f"{'算法':<6} {'成功率':<8} {'延迟(ms)':<10} {'路径数':<8} {'平均跳数':<8} {'执行时间(s)':<10}",
+            "-" * 90,
+        ]
+        lines.extend(_result_row(result.algorithm, result.success_rate, result.avg_delay,
+                                 result.avg_paths_per_demand, result.avg_path_length,
+                                 result.execution_time)
+                     for result in results)
+        lines.append("=" * 90)
+        # 整张表一次写出，多进程同时输出时不会交错
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def export_results(self, results):
-        """导出结果到CSV，并增加了您要求的终端打印验证功能"""
+        """导出结果到CSV，verbose模式下先在终端打印即将写入的数据以供验证"""
         if not results:
             print("⚠️ 没有结果可以导出。")
             return
 
-        print("\n" + "🔍" * 45)
-        print("🔍 【验证】以下是即将写入CSV文件的确切数据:")
-        print("🔍" * 45)
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            from output.result_exporter import export_benchmark_comparison
+
             benchmark_results_for_csv = {}
+            lines = ["\n" + "🔍" * 45, "🔍 【验证】以下是即将写入CSV文件的确切数据:", "🔍" * 45]
             for result in results:
-                algo_name = result['algorithm']
-                metrics_for_csv = {k: v for k, v in result.items() if k not in ['avg_delay', 'execution_time']}
-                print(f"\n算法: {algo_name}")
-                for key, value in metrics_for_csv.items():
-                    print(f"  {key:<25}: {value}")
-                benchmark_results_for_csv[algo_name] = {'metrics': metrics_for_csv}
-
-            print("\n" + "🔍" * 45)
-            csv_path = export_benchmark_comparison(benchmark_results_for_csv, timestamp)
-            print(f"\n📊 修复延迟的结果已导出: {csv_path}")
-            print("✅ 现在CSV中应该有合理的延迟数值了!")
+                metrics_for_csv = {k: getattr(result, k) for k in CSV_FIELDS}
+                if self.verbose:
+                    lines.append(f"\n算法: {result.algorithm}")
+                    lines.extend(f"  {key:<25}: {value}" for key, value in metrics_for_csv.items())
+                benchmark_results_for_csv[result.algorithm] = {'metrics': metrics_for_csv}
+            if self.verbose:
+                lines.append("\n" + "🔍" * 45)
+                print("\n".join(lines))
+
+            csv_path = export_benchmark_comparison(benchmark_results_for_csv, self.timestamp)
+            print(f"\n📊 基准测试结果已导出: {csv_path}")
         except Exception as e:
             print(f"⚠️  导出失败: {e}")
 
-
 def main():
     """主函数"""
-    print("🔧 LDMR延迟修复版基准测试")
-    print("   修复内容: 强制为所有链路设置合理的、非零的延迟值")
+    print("🔧 LDMR基准测试")
     config = load_config()
-    benchmark = FixedDelayBenchmark(config)
+    args = sys.argv[1:]
+    # --warm-numba: 在父进程中先编译/加载JIT内核，fork出的算法子进程直接继承，
+    # 不再各自加载一遍
+    if '--warm-numba' in args:
+        warmup_kernels()
+    # --verbose: 打印写入CSV的逐项数据
+    # --quiet 或 LDMR_QUIET=1: 丢弃算法的逐需求日志，只输出各算法汇总和结果表
+    quiet = '--quiet' in args or os.environ.get('LDMR_QUIET') == '1'
+    benchmark = FixedDelayBenchmark(config, verbose='--verbose' in args, quiet=quiet)
     benchmark.run_benchmark()
-    print("\n✅ 延迟修复版基准测试完成!")
+    print("\n✅ 基准测试完成!")
 
 
 if __name__ == "__main__":
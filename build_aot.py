@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+预编译路径计算内核 (numba AOT)
+将 src/algorithms/jit_kernels.py 中的内核编译为本地扩展模块 algorithms.ldmr_native，
+之后运行的脚本直接导入该模块，不再导入numba、也不再加载JIT缓存
+
+用法: python build_aot.py
+修改 jit_kernels.py 后需重新编译（扩展模块比源码旧时会被忽略，自动回退到JIT）
+"""
+
+import sys
+from pathlib import Path
+
+# 添加项目路径
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root / 'src'))
+
+OUTPUT_DIR = project_root / 'src' / 'algorithms'
+MODULE_NAME = 'ldmr_native'
+
+
+def build():
+    """编译并写出扩展模块"""
+    # 先删除旧的扩展模块，保证 jit_kernels 以numba内核导入，供 pycc 编译其调用链
+    for old in OUTPUT_DIR.glob(f'{MODULE_NAME}*.so'):
+        old.unlink()
+
+    from numba.pycc import CC
+    from algorithms import jit_kernels as k
+
+    if not k.NUMBA_AVAILABLE:
+        print("❌ 未安装numba，无法预编译")
+        return None
+
+    cc = CC(MODULE_NAME)
+    cc.output_dir = str(OUTPUT_DIR)
+    cc.verbose = False
+
+    cc.export('dijkstra_csr_into', k._DIJKSTRA_INTO_SIG)(k.dijkstra_csr_into.py_func)
+    cc.export('dijkstra_csr', k._DIJKSTRA_SIG)(k.dijkstra_csr.py_func)
+    cc.export('dijkstra_csr_multi', k._DIJKSTRA_MULTI_SIG)(k.dijkstra_csr_multi.py_func)
+    cc.export('path_stats_kernel', k._PATH_STATS_SIG)(k._path_stats_kernel.py_func)
+    cc.export('jain_kernel', k._JAIN_SIG)(k._jain_kernel.py_func)
+
+    print(f"🔧 编译 {MODULE_NAME} ...")
+    cc.compile()
+    built = next(OUTPUT_DIR.glob(f'{MODULE_NAME}*.so'), None)
+    print(f"✅ 已生成: {built}")
+    return built
+
+
+if __name__ == "__main__":
+    build()
@@ -6,14 +6,34 @@
 
 import yaml
 import os
-from pathlib import Path
+import copy
+from types import SimpleNamespace
+
+# 优先使用libyaml的C实现解析器
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
+# (绝对路径, 修改时间) -> 解析结果，文件修改后自动重新解析
+_config_cache = {}
+
+# 场景目录的 (绝对路径, 修改时间) 及对应的场景列表
+_scenario_cache = {}
 
 
 def load_config(config_file='config/default.yaml'):
-    """加载配置文件"""
+    """加载配置文件（按文件修改时间缓存，返回副本，调用方可自由修改）"""
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        key = (os.path.abspath(config_file), os.path.getmtime(config_file))
+        if key not in _config_cache:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                parsed = yaml.load(f, Loader=_YamlLoader)
+            # 丢弃同一文件旧版本的缓存
+            for stale_key in [k for k in _config_cache if k[0] == key[0]]:
+                del _config_cache[stale_key]
+            _config_cache[key] = parsed
+        return copy.deepcopy(_config_cache[key])
     except FileNotFoundError:
         print(f"❌ 配置文件不存在: {config_file}")
         return get_default_config()
@@ -22,6 +42,15 @@ def load_config(config_file='config/default.yaml'):
         return get_default_config()
 
 
+def as_ns(cfg):
+    """将配置字典递归转换为 SimpleNamespace，以属性访问代替多级下标"""
+    if type(cfg) is dict:
+        return SimpleNamespace(**{key: as_ns(value) for key, value in cfg.items()})
+    if type(cfg) is list:
+        return [as_ns(item) for item in cfg]
+    return cfg
+
+
 def get_default_config():
     """默认配置"""
     return {
@@ -37,26 +66,33 @@ def get_default_config():
             'r2': 10,
             'r3': 50,
             'Ne_th': 2,
-            'enable_statistics': True
+            'enable_statistics': True,
+            'seed': None
         },
         'traffic': {
             'total_gbps': 6.0,
             'duration': 180.0,
-            'elephant_ratio': 0.3
+            'elephant_ratio': 0.3,
+            'seed': None
         }
     }
 
 
 def list_scenarios():
-    """列出可用场景"""
-    scenarios_dir = Path('config/scenarios')
-    if not scenarios_dir.exists():
+    """列出可用场景（按目录修改时间缓存，增删场景文件后自动重新扫描）"""
+    scenarios_dir = 'config/scenarios'
+    try:
+        key = (os.path.abspath(scenarios_dir), os.stat(scenarios_dir).st_mtime_ns)
+    except OSError:
         return []
 
-    scenarios = []
-    for file in scenarios_dir.glob('*.yaml'):
-        scenarios.append(file.stem)
-    return scenarios
+    if _scenario_cache.get('key') != key:
+        with os.scandir(scenarios_dir) as entries:
+            scenarios = [entry.name[:-len('.yaml')] for entry in entries
+                         if entry.name.endswith('.yaml') and entry.is_file()]
+        _scenario_cache['key'] = key
+        _scenario_cache['scenarios'] = scenarios
+    return list(_scenario_cache['scenarios'])
 
 
 def load_scenario(scenario_name):
@@ -72,12 +108,15 @@ def load_scenario(scenario_name):
 
 
 def merge_config(base, override):
-    """合并配置"""
-    for key, value in override.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            merge_config(base[key], value)
-        else:
-            base[key] = value
+    """合并配置（用显式栈迭代处理嵌套字典，YAML解析结果只含普通dict）"""
+    stack = [(base, override)]
+    while stack:
+        base_dict, override_dict = stack.pop()
+        for key, value in override_dict.items():
+            if type(value) is dict and type(base_dict.get(key)) is dict:
+                stack.append((base_dict[key], value))
+            else:
+                base_dict[key] = value
 
 
 def save_current_scenario(scenario_name):
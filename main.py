@@ -6,17 +6,58 @@ LDMR算法主程序
 
 import sys
 import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from datetime import datetime
 
 # 添加项目路径
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / 'src'))
 
-from config import load_config, list_scenarios
-from benchmark import SimpleBenchmark
-from param_analysis import ParameterAnalysis
-from output.result_exporter import export_all_results
-from output.visualizer import generate_all_visualizations
+from config import load_config, load_scenario, list_scenarios
+# 基准测试、参数分析和输出模块（依赖numpy/networkx/matplotlib）在各功能函数内按需导入，
+# 加快菜单启动；重复进入时由 sys.modules 缓存，不会重复导入
+
+# 会话内共享的 (拓扑, 流量需求)，键为网络与流量配置，各菜单功能复用同一份
+_session = {}
+
+# 后台写摘要报告的线程；退出前等待其完成，避免报告丢失或写到一半
+_report_threads = []
+
+
+def _write_lines(lines):
+    """多行结果拼接后一次写出，避免逐行 print"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def get_fixture(config):
+    """获取与配置对应的 (拓扑, 流量需求)，同一会话内只构建一次"""
+    key = json.dumps({'network': config['network'], 'traffic': config['traffic']}, sort_keys=True)
+    if key not in _session:
+        from benchmark import cached_build_network
+        from traffic.traffic_model import generate_demands
+
+        # 创建网络
+        print("🔧 构建网络...")
+        topology = cached_build_network(config)
+
+        # 生成流量
+        print("📈 生成流量...")
+        demands = generate_demands(
+            ground_station_ids=topology.ground_station_ids,
+            total_traffic=config['traffic']['total_gbps'],
+            duration=config['traffic']['duration'],
+            elephant_ratio=config['traffic'].get('elephant_ratio', 0.3),
+            seed=config['traffic'].get('seed')
+        )
+        _session[key] = (topology, demands)
+    else:
+        print("♻️  复用本次会话已生成的网络和流量")
+    return _session[key]
+
 
 # 简单的LDMR运行功能
 def run_ldmr_only():
@@ -25,33 +66,13 @@ def run_ldmr_only():
     print("=" * 40)
 
     try:
-        from topology.satellite_constellation import LEONetworkBuilder
-        from traffic.traffic_model import TrafficGenerator
         from algorithms.ldmr_algorithms import LDMRAlgorithm, LDMRConfig
 
         # 加载配置
         config = load_config()
 
-        # 创建网络
-        print("🔧 构建网络...")
-        builder = LEONetworkBuilder(
-            config['network']['constellation'],
-            config['network']['ground_stations']
-        )
-        topology = builder.build_network()
-
-        # 生成流量
-        print("📈 生成流量...")
-        generator = TrafficGenerator()
-        ground_stations = [
-            node.id for node in topology.nodes.values()
-            if node.type.value == 'ground_station'
-        ]
-        demands = generator.generate_traffic_demands(
-            ground_station_ids=ground_stations,
-            total_traffic=config['traffic']['total_gbps'],
-            duration=config['traffic']['duration']
-        )
+        # 网络和流量
+        topology, demands = get_fixture(config)
 
         # 运行LDMR
         print("⚡ 运行LDMR算法...")
@@ -60,7 +81,8 @@ def run_ldmr_only():
             r1=config['algorithm']['r1'],
             r2=config['algorithm']['r2'],
             r3=config['algorithm']['r3'],
-            Ne_th=config['algorithm']['Ne_th']
+            Ne_th=config['algorithm']['Ne_th'],
+            seed=config['algorithm'].get('seed')
         )
 
         ldmr = LDMRAlgorithm(ldmr_config)
@@ -70,36 +92,51 @@ def run_ldmr_only():
         stats = ldmr.get_algorithm_statistics(results)
         disjoint_stats = ldmr.verify_path_disjointness(results)
 
-        print("\n📊 LDMR运行结果:")
-        print(f"   成功率: {stats.get('success_rate', 0):.1%}")
-        print(f"   平均延迟: {stats.get('avg_path_delay', 0) * 1000:.2f}ms")
-        print(f"   总路径数: {stats.get('total_paths_calculated', 0)}")
-        print(f"   平均路径数: {stats.get('avg_paths_per_demand', 0):.1f}")
-        print(f"   路径不相交率: {disjoint_stats.get('disjoint_rate', 0):.1%}")
-        print(f"   执行时间: {stats.get('total_computation_time', 0):.2f}s")
-
-        print("✅ LDMR算法运行完成!")
+        # 结果各行拼好后一次写出
+        _write_lines([
+            "\n📊 LDMR运行结果:",
+            f"   成功率: {stats.get('success_rate', 0):.1%}",
+            f"   平均延迟: {stats.get('avg_path_delay', 0):.2f}ms",
+            f"   总路径数: {stats.get('total_paths_calculated', 0)}",
+            f"   平均路径数: {stats.get('avg_paths_per_demand', 0):.1f}",
+            f"   路径不相交率: {disjoint_stats.get('disjoint_rate', 0):.1%}",
+            f"   执行时间: {stats.get('total_computation_time', 0):.2f}s",
+            "✅ LDMR算法运行完成!",
+        ])
 
         # 导出结果和生成图表
         print("\n📊 导出结果和生成图表...")
         try:
-            # 导出结果数据
-            output_files = export_all_results(
-                ldmr_results=results,
-                config=config
-            )
+            from output.result_exporter import export_all_results
+            from output.visualizer import generate_all_visualizations
 
-            # 生成可视化图表
-            chart_files = generate_all_visualizations(
-                ldmr_results=results
-            )
+            # 数据文件和图表共用一个时间戳
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-            print("✅ 结果导出和可视化完成!")
-            print("📁 查看输出文件:")
-            print(f"   数据文件: {output_files.get('ldmr_csv', 'N/A')}")
-            print(f"   摘要报告: {output_files.get('summary_txt', 'N/A')}")
-            print(f"   路径分析图: {chart_files.get('path_analysis', 'N/A')}")
-            print(f"   性能趋势图: {chart_files.get('performance_trends', 'N/A')}")
+            # 导出结果数据（后台线程写文件，与绘图重叠）
+            with ThreadPoolExecutor(max_workers=1) as io_pool:
+                export_future = io_pool.submit(
+                    export_all_results,
+                    ldmr_results=results,
+                    config=config,
+                    timestamp=timestamp
+                )
+
+                # 生成可视化图表（matplotlib留在主线程）
+                chart_files = generate_all_visualizations(
+                    ldmr_results=results,
+                    timestamp=timestamp
+                )
+                output_files = export_future.result()
+
+            _write_lines([
+                "✅ 结果导出和可视化完成!",
+                "📁 查看输出文件:",
+                f"   数据文件: {output_files.get('ldmr_csv', 'N/A')}",
+                f"   摘要报告: {output_files.get('summary_txt', 'N/A')}",
+                f"   路径分析图: {chart_files.get('path_analysis', 'N/A')}",
+                f"   性能趋势图: {chart_files.get('performance_trends', 'N/A')}",
+            ])
 
         except Exception as e:
             print(f"⚠️  输出生成失败: {e}")
@@ -114,9 +151,12 @@ def run_benchmark():
     print("=" * 40)
 
     try:
+        from benchmark import FixedDelayBenchmark
+
         config = load_config()
-        benchmark = SimpleBenchmark(config)
-        benchmark.run_benchmark()
+        topology, demands = get_fixture(config)
+        benchmark = FixedDelayBenchmark(config)
+        benchmark.run_benchmark(topology=topology, demands=demands)
 
     except Exception as e:
         print(f"❌ 基准测试失败: {e}")
@@ -128,9 +168,12 @@ def run_param_analysis():
     print("=" * 40)
 
     try:
+        from param_analysis import ParameterAnalysis
+
         config = load_config()
         analyzer = ParameterAnalysis(config)
-        analyzer.run_full_analysis()
+        # 与独立运行 param_analysis.py 使用相同的测试环境配置（含 traffic.seed），会话缓存按其取键
+        analyzer.run_full_analysis(fixture=get_fixture(analyzer.fixture_config()))
 
     except Exception as e:
         print(f"❌ 参数分析失败: {e}")
@@ -148,9 +191,7 @@ def switch_scenario():
             print("❌ 没有找到可用场景")
             return
 
-        print("可用场景:")
-        for i, scenario in enumerate(scenarios, 1):
-            print(f"  {i}. {scenario}")
+        _write_lines(["可用场景:"] + [f"  {i}. {scenario}" for i, scenario in enumerate(scenarios, 1)])
 
         choice = input("\n请选择场景 (输入编号): ").strip()
 
@@ -159,21 +200,24 @@ def switch_scenario():
             if 0 <= scenario_idx < len(scenarios):
                 scenario_name = scenarios[scenario_idx]
 
-                # 加载并显示场景配置
-                config = load_config(scenario_name)
-                print(f"\n✅ 已切换到场景: {scenario_name}")
-                print("场景配置:")
-                print(f"   星座类型: {config['network']['constellation']}")
-                print(f"   地面站数: {config['network']['ground_stations']}")
-                print(f"   总流量: {config['traffic']['total_gbps']} Gbps")
-                print(f"   算法K值: {config['algorithm']['K']}")
-                print(f"   算法r3值: {config['algorithm']['r3']}")
+                # 加载并显示场景配置（场景文件经 load_config 按修改时间缓存，与默认配置合并）
+                config = load_scenario(scenario_name)
+                _write_lines([
+                    f"\n✅ 已切换到场景: {scenario_name}",
+                    "场景配置:",
+                    f"   星座类型: {config['network']['constellation']}",
+                    f"   地面站数: {config['network']['ground_stations']}",
+                    f"   总流量: {config['traffic']['total_gbps']} Gbps",
+                    f"   算法K值: {config['algorithm']['K']}",
+                    f"   算法r3值: {config['algorithm']['r3']}",
+                ])
 
                 # 询问是否运行
                 run_now = input("\n是否立即运行LDMR? (y/n): ").strip().lower()
                 if run_now == 'y':
+                    save_report = input("是否保存详细报告? (y/n): ").strip().lower() == 'y'
                     # 临时使用新配置运行LDMR
-                    run_ldmr_with_config(config)
+                    run_ldmr_with_config(config, save_report=save_report)
 
             else:
                 print("❌ 无效选择")
@@ -185,33 +229,37 @@ def switch_scenario():
         print(f"❌ 场景切换失败: {e}")
 
 
-def run_ldmr_with_config(config):
-    """使用指定配置运行LDMR"""
+def _write_summary_report(results, config, timestamp):
+    """只导出摘要报告"""
+    try:
+        from output.result_exporter import ResultExporter
+        exporter = ResultExporter()
+        summary_path = exporter.generate_summary_report(
+            ldmr_results=results,
+            config=config,
+            timestamp=timestamp
+        )
+        print(f"📝 详细报告: {summary_path}")
+
+    except Exception as e:
+        print(f"⚠️  报告生成失败: {e}")
+
+
+def run_ldmr_with_config(config, save_report=False):
+    """使用指定配置运行LDMR
+
+    Args:
+        config: 配置字典
+        save_report: 是否导出摘要报告（后台写入，默认关闭以便快速返回菜单）
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     try:
-        from topology.satellite_constellation import LEONetworkBuilder
-        from traffic.traffic_model import TrafficGenerator
         from algorithms.ldmr_algorithms import LDMRAlgorithm, LDMRConfig
 
         print("\n🚀 使用新场景运行LDMR...")
 
-        # 创建网络
-        builder = LEONetworkBuilder(
-            config['network']['constellation'],
-            config['network']['ground_stations']
-        )
-        topology = builder.build_network()
-
-        # 生成流量
-        generator = TrafficGenerator()
-        ground_stations = [
-            node.id for node in topology.nodes.values()
-            if node.type.value == 'ground_station'
-        ]
-        demands = generator.generate_traffic_demands(
-            ground_station_ids=ground_stations,
-            total_traffic=config['traffic']['total_gbps'],
-            duration=config['traffic']['duration']
-        )
+        # 网络和流量
+        topology, demands = get_fixture(config)
 
         # 运行LDMR
         ldmr_config = LDMRConfig(
@@ -219,7 +267,8 @@ def run_ldmr_with_config(config):
             r1=config['algorithm']['r1'],
             r2=config['algorithm']['r2'],
             r3=config['algorithm']['r3'],
-            Ne_th=config['algorithm']['Ne_th']
+            Ne_th=config['algorithm']['Ne_th'],
+            seed=config['algorithm'].get('seed')
         )
 
         ldmr = LDMRAlgorithm(ldmr_config)
@@ -228,82 +277,94 @@ def run_ldmr_with_config(config):
         # 显示结果
         stats = ldmr.get_algorithm_statistics(results)
         print(f"\n📊 结果: 成功率={stats.get('success_rate', 0):.1%}, "
-              f"延迟={stats.get('avg_path_delay', 0) * 1000:.2f}ms")
-
-        # 快速导出结果
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+              f"延迟={stats.get('avg_path_delay', 0):.2f}ms")
 
-            # 只导出摘要报告
-            from output.result_exporter import ResultExporter
-            exporter = ResultExporter()
-            summary_path = exporter.generate_summary_report(
-                ldmr_results=results,
-                config=config,
-                timestamp=timestamp
+        # 摘要报告在后台线程中写出，菜单无需等待文件写入；程序退出前由 main 等待写完
+        if save_report:
+            thread = threading.Thread(
+                target=_write_summary_report,
+                args=(results, config, timestamp)
             )
-
-            print(f"📝 详细报告: {summary_path}")
-
-        except Exception as e:
-            print(f"⚠️  报告生成失败: {e}")
-
+            thread.start()
+            _report_threads.append(thread)
+            print("📝 详细报告后台生成中...")
 
     except Exception as e:
         print(f"❌ 运行失败: {e}")
 
 
+# 菜单文本固定不变，模块加载时拼好，每次显示只输出一次
+_MENU_TEXT = "\n".join([
+    "\n" + "=" * 50,
+    "🎯 LDMR算法仿真系统",
+    "=" * 50,
+    "1. 🚀 运行LDMR算法",
+    "2. 📊 基准算法对比 (LDMR vs SPF vs ECMP)",
+    "3. 🔬 参数敏感性分析",
+    "4. 🔄 切换场景配置",
+    "5. ❌ 退出",
+    "=" * 50,
+])
+
+
 def show_menu():
     """显示主菜单"""
-    print("\n" + "=" * 50)
-    print("🎯 LDMR算法仿真系统")
-    print("=" * 50)
-    print("1. 🚀 运行LDMR算法")
-    print("2. 📊 基准算法对比 (LDMR vs SPF vs ECMP)")
-    print("3. 🔬 参数敏感性分析")
-    print("4. 🔄 切换场景配置")
-    print("5. ❌ 退出")
-    print("=" * 50)
+    print(_MENU_TEXT)
 
     return input("请选择功能 (1-5): ").strip()
 
 
+def _wait_for_reports():
+    """等待尚未写完的后台摘要报告"""
+    pending = [thread for thread in _report_threads if thread.is_alive()]
+    if pending:
+        print(f"⏳ 等待 {len(pending)} 份详细报告写入完成...")
+    for thread in pending:
+        thread.join()
+    _report_threads.clear()
+
+
 def main():
     """主函数"""
     print("🎯 LDMR算法简化仿真系统")
     print("   核心功能: LDMR算法、基准对比、参数分析、场景切换")
 
-    while True:
-        try:
-            choice = show_menu()
+    try:
+        while True:
+            try:
+                choice = show_menu()
 
-            if choice == '1':
-                run_ldmr_only()
+                if choice == '1':
+                    run_ldmr_only()
 
-            elif choice == '2':
-                run_benchmark()
+                elif choice == '2':
+                    run_benchmark()
 
-            elif choice == '3':
-                run_param_analysis()
+                elif choice == '3':
+                    run_param_analysis()
 
-            elif choice == '4':
-                switch_scenario()
+                elif choice == '4':
+                    switch_scenario()
 
-            elif choice == '5':
-                print("\n👋 退出程序")
-                break
+                elif choice == '5':
+                    print("\n👋 退出程序")
+                    break
 
-            else:
-                print("❌ 无效选择，请重新输入")
+                else:
+                    print("❌ 无效选择，请重新输入")
 
-            input("\n按回车键继续...")
+                input("\n按回车键继续...")
 
-        except KeyboardInterrupt:
-            print("\n\n👋 程序被用户中断")
-            break
-        except Exception as e:
-            print(f"\n❌ 程序错误: {e}")
-            input("按回车键继续...")
+            except KeyboardInterrupt:
+                print("\n\n👋 程序被用户中断")
+                break
+            except Exception as e:
+                print(f"\n❌ 程序错误: {e}")
+                input("按回车键继续...")
+
+    finally:
+        # 无论正常退出还是异常中断，都先让后台报告写完
+        _wait_for_reports()
 
 
 if __name__ == "__main__":
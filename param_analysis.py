@@ -4,44 +4,142 @@ LDMR参数敏感性分析
 测试关键参数对性能的影响
 """
 
+import os
 import sys
 import time
+import contextlib
+from dataclasses import dataclass, replace
 from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 # 添加项目路径
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / 'src'))
 
-from config import load_config
-from topology.satellite_constellation import LEONetworkBuilder
-from traffic.traffic_model import TrafficGenerator
+from config import load_config, as_ns
+from benchmark import cached_build_network
+from traffic.traffic_model import generate_demands
 from algorithms.ldmr_algorithms import LDMRAlgorithm, LDMRConfig
-from output.result_exporter import export_parameter_analysis
-from output.visualizer import plot_parameter_sensitivity
+
+
+# 参数扫描子进程共享的 (拓扑, 流量需求) 和LDMR实例，由进程池初始化函数在每个子进程中设置一次
+_worker_fixture = None
+_worker_ldmr = None
+
+
+def _init_sweep_worker(topology, demands):
+    """进程池初始化: 拓扑和流量需求每个子进程只传递一次，而不是随每个任务传递"""
+    global _worker_fixture, _worker_ldmr
+    _worker_fixture = (topology, demands)
+    _worker_ldmr = LDMRAlgorithm()
+
+
+def _evaluate_parameter_value(config, fixture=None, ldmr=None, quiet=False):
+    """用给定配置运行一次LDMR并汇总指标
+
+    同一次扫描复用一个LDMR实例，拓扑的CSR结构只建立一次；
+    quiet=True 时丢弃LDMR的逐需求日志（进程池子进程中总是如此，避免多个进程的输出交错）
+    """
+    topology, demands = fixture if fixture is not None else _worker_fixture
+    ldmr = ldmr if ldmr is not None else _worker_ldmr
+    ldmr.reconfigure(config)
+    with contextlib.ExitStack() as stack:
+        if quiet:
+            stack.enter_context(contextlib.redirect_stdout(
+                stack.enter_context(open(os.devnull, 'w'))))
+        start_ns = time.perf_counter_ns()
+        ldmr_results = ldmr.run_ldmr_algorithm(topology, demands)
+        exec_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+    # 计算指标
+    stats = ldmr.get_algorithm_statistics(ldmr_results)
+    disjoint_stats = LDMRAlgorithm.verify_path_disjointness(ldmr_results)
+
+    return {
+        'success_rate': stats.get('success_rate', 0),
+        'avg_delay': stats.get('avg_path_delay', 0),
+        'total_paths': stats.get('total_paths_calculated', 0),
+        'avg_computation_time': stats.get('avg_computation_time', 0),
+        'execution_time': exec_time,
+        'disjoint_rate': disjoint_stats.get('disjoint_rate', 0)
+    }
+
+
+# 单次参数测试汇总的指标，顺序与 _evaluate_parameter_value 返回的字典一致
+SWEEP_METRICS = ('success_rate', 'avg_delay', 'total_paths', 'avg_computation_time',
+                 'execution_time', 'disjoint_rate')
+
+
+@dataclass
+class SweepResults:
+    """单个参数扫描的结果，每个指标一个按取值顺序排列的数组，失败的取值由 error_mask 标记"""
+    param_values: np.ndarray
+    success_rate: np.ndarray
+    avg_delay: np.ndarray
+    total_paths: np.ndarray
+    avg_computation_time: np.ndarray
+    execution_time: np.ndarray
+    disjoint_rate: np.ndarray
+    error_mask: np.ndarray
+
+    @classmethod
+    def empty(cls, param_values):
+        """按取值个数预分配数组，初始全部标记为失败"""
+        n = len(param_values)
+        metrics = {name: np.zeros(n, dtype=np.int64 if name == 'total_paths' else np.float64)
+                   for name in SWEEP_METRICS}
+        return cls(param_values=np.asarray(param_values), error_mask=np.ones(n, dtype=np.bool_),
+                   **metrics)
+
+    def record(self, i, metrics):
+        """写入第i个取值的指标"""
+        for name in SWEEP_METRICS:
+            getattr(self, name)[i] = metrics[name]
+        self.error_mask[i] = False
+
+    def result_at(self, i):
+        """第i个取值的指标字典（导出与总结显示使用）"""
+        return {name: getattr(self, name)[i].item() for name in SWEEP_METRICS}
 
 
 class ParameterAnalysis:
-    def __init__(self, base_config):
+    # 参数测试使用的小规模网络与流量（加快测试）
+    TEST_SETUP = {
+        'network': {'constellation': 'globalstar', 'ground_stations': 8},
+        'traffic': {'total_gbps': 4.0, 'duration': 120.0},
+    }
+
+    def __init__(self, base_config, quiet=False):
         self.base_config = base_config
+        self.cfg = as_ns(base_config)
+        # 静默模式下每个取值只输出一行结果
+        self.quiet = quiet
+
+    def fixture_config(self):
+        """测试环境的网络与流量配置: TEST_SETUP 加上基础配置中的流量随机种子
+
+        独立运行和主菜单调用共用此配置，设置 traffic.seed 后两者生成相同的流量
+        """
+        return {**self.TEST_SETUP,
+                'traffic': {**self.TEST_SETUP['traffic'],
+                            'seed': self.base_config.get('traffic', {}).get('seed')}}
 
     def create_test_setup(self):
         """创建测试环境（小规模，快速测试）"""
         print("🔧 创建测试环境...")
+        setup = self.fixture_config()
 
-        # 使用较小规模以加快测试
-        builder = LEONetworkBuilder('globalstar', 8)
-        topology = builder.build_network()
-
-        generator = TrafficGenerator()
-        ground_stations = [
-            node.id for node in topology.nodes.values()
-            if node.type.value == 'ground_station'
-        ]
+        # 使用较小规模以加快测试；相同网络配置的拓扑与基准测试共用内存/磁盘缓存
+        topology = cached_build_network(setup)
 
-        demands = generator.generate_traffic_demands(
-            ground_station_ids=ground_stations,
-            total_traffic=4.0,  # 较小流量
-            duration=120.0  # 较短时间
+        demands = generate_demands(
+            ground_station_ids=topology.ground_station_ids,
+            total_traffic=setup['traffic']['total_gbps'],  # 较小流量
+            duration=setup['traffic']['duration'],  # 较短时间
+            seed=setup['traffic']['seed']
         )
 
         print(f"   测试网络: {len(topology.nodes)}节点, {len(topology.links)}链路")
@@ -49,62 +147,72 @@ class ParameterAnalysis:
 
         return topology, demands
 
-    def test_single_parameter(self, topology, demands, param_name, param_values):
-        """测试单个参数的影响"""
+    def base_ldmr_config(self):
+        """由基础配置生成的LDMR配置，参数扫描以此为模板"""
+        algorithm = self.cfg.algorithm
+        return LDMRConfig(
+            K=algorithm.K,
+            r1=algorithm.r1,
+            r2=algorithm.r2,
+            r3=algorithm.r3,
+            Ne_th=algorithm.Ne_th,
+            enable_statistics=True,
+            seed=getattr(algorithm, 'seed', None)
+        )
+
+    def make_config(self, param_name, value, base=None):
+        """以基础配置为准，替换被测参数生成LDMR配置（param_name 为 LDMRConfig 的字段名）"""
+        return replace(base or self.base_ldmr_config(), **{param_name: value})
+
+    def test_single_parameter(self, topology, demands, param_name, param_values, parallel=True):
+        """测试单个参数的影响
+
+        各取值只改变LDMR配置、互不依赖，默认在进程池中并发运行，
+        结果仍按取值顺序输出
+        """
         print(f"\n🔬 测试参数: {param_name}")
         print(f"   测试值: {param_values}")
 
-        results = {}
-
-        for value in param_values:
-            print(f"   测试 {param_name}={value}...")
-
-            # 创建配置
-            config = LDMRConfig(
-                K=self.base_config['algorithm']['K'],
-                r1=self.base_config['algorithm']['r1'],
-                r2=self.base_config['algorithm']['r2'],
-                r3=self.base_config['algorithm']['r3'],
-                Ne_th=self.base_config['algorithm']['Ne_th'],
-                enable_statistics=True
-            )
-
-            # 修改测试参数
-            if param_name == 'r3':
-                config.r3 = value
-            elif param_name == 'K':
-                config.K = value
-            elif param_name == 'Ne_th':
-                config.Ne_th = value
-            elif param_name == 'r2':
-                config.r2 = value
-
-            try:
-                # 运行LDMR
-                ldmr = LDMRAlgorithm(config)
-                start_time = time.time()
-                ldmr_results = ldmr.run_ldmr_algorithm(topology, demands)
-                exec_time = time.time() - start_time
-
-                # 计算指标
-                stats = ldmr.get_algorithm_statistics(ldmr_results)
-                disjoint_stats = ldmr.verify_path_disjointness(ldmr_results)
-
-                results[value] = {
-                    'success_rate': stats.get('success_rate', 0),
-                    'avg_delay': stats.get('avg_path_delay', 0) * 1000,
-                    'total_paths': stats.get('total_paths_calculated', 0),
-                    'avg_computation_time': stats.get('avg_computation_time', 0),
-                    'execution_time': exec_time,
-                    'disjoint_rate': disjoint_stats.get('disjoint_rate', 0)
-                }
-
-                print(f"     成功率: {results[value]['success_rate']:.1%}, "
-                      f"延迟: {results[value]['avg_delay']:.2f}ms")
-
-            except Exception as e:
-                print(f"     ❌ 失败: {e}")
-                results[value] = {'error': str(e)}
+        results = SweepResults.empty(param_values)
+        base = self.base_ldmr_config()
+        configs = [(i, value, self.make_config(param_name, value, base))
+                   for i, value in enumerate(param_values)]
+
+        def announce(value):
+            if not self.quiet:
+                print(f"   测试 {param_name}={value}...")
+
+        def report(i, value, outcome):
+            prefix = f"   {param_name}={value}: " if self.quiet else "     "
+            if isinstance(outcome, Exception):
+                print(f"{prefix}❌ 失败: {outcome}")
+            else:
+                results.record(i, outcome)
+                print(f"{prefix}成功率: {outcome['success_rate']:.1%}, "
+                      f"延迟: {outcome['avg_delay']:.2f}ms")
+
+        max_workers = min(len(configs), os.cpu_count() or 1)
+        # 单核环境下进程池只有额外开销，直接在本进程中顺序运行
+        if parallel and max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_sweep_worker,
+                                     initargs=(topology, demands)) as executor:
+                futures = [(i, value, executor.submit(_evaluate_parameter_value, config, quiet=True))
+                           for i, value, config in configs]
+                for i, value, future in futures:
+                    announce(value)
+                    try:
+                        report(i, value, future.result())
+                    except Exception as e:
+                        report(i, value, e)
+        else:
+            ldmr = LDMRAlgorithm(base)
+            for i, value, config in configs:
+                announce(value)
+                try:
+                    report(i, value, _evaluate_parameter_value(config, (topology, demands), ldmr,
+                                                               quiet=self.quiet))
+                except Exception as e:
+                    report(i, value, e)
 
         return results
 
@@ -143,18 +251,18 @@ class ParameterAnalysis:
 
     def find_best_parameter(self, param_name, results):
         """找到最优参数值"""
-        valid_results = {k: v for k, v in results.items() if 'error' not in v}
+        valid = np.flatnonzero(~results.error_mask)
 
-        if not valid_results:
+        if not valid.size:
             print(f"   ❌ {param_name}参数测试全部失败")
-            return None
-
-        # 按成功率排序，成功率相同时按延迟排序
-        best_value = max(valid_results.keys(),
-                         key=lambda x: (valid_results[x]['success_rate'],
-                                        -valid_results[x]['avg_delay']))
-
-        best_result = valid_results[best_value]
+            return None, None
+
+        # 按成功率排序，成功率相同时按延迟排序，再相同时取先测试的值；
+        # lexsort 以最后一个键为主键，升序排列后末尾即最优
+        best = valid[np.lexsort((-valid, -results.avg_delay[valid],
+                                 results.success_rate[valid]))[-1]]
+        best_value = results.param_values[best].item()
+        best_result = results.result_at(best)
         print(f"\n🎯 最优{param_name}值: {best_value}")
         print(f"   成功率: {best_result['success_rate']:.1%}")
         print(f"   平均延迟: {best_result['avg_delay']:.2f}ms")
@@ -164,32 +272,48 @@ class ParameterAnalysis:
 
     def display_parameter_summary(self, param_results):
         """显示参数分析总结"""
-        print("\n" + "=" * 60)
-        print("📋 参数敏感性分析总结")
-        print("=" * 60)
+        lines = [
+            "\n" + "=" * 60,
+            "📋 参数敏感性分析总结",
+            "=" * 60,
+        ]
 
         for param_name, (best_value, best_result) in param_results.items():
             if best_value is not None:
-                print(f"{param_name}最优值: {best_value}")
-                print(f"  - 成功率: {best_result['success_rate']:.1%}")
-                print(f"  - 平均延迟: {best_result['avg_delay']:.2f}ms")
-                print(f"  - 执行时间: {best_result['execution_time']:.2f}s")
-                print()
-
-        print("💡 参数调优建议:")
-        print("  1. r3=50 通常是最优选择（论文验证）")
-        print("  2. K=2 在性能和复杂度间取得平衡")
-        print("  3. Ne_th=2 适合大多数场景")
-        print("  4. 高负载场景可考虑增大Ne_th值")
-        print("=" * 60)
-
-    def run_full_analysis(self):
-        """运行完整参数分析"""
+                lines.extend([
+                    f"{param_name}最优值: {best_value}",
+                    f"  - 成功率: {best_result['success_rate']:.1%}",
+                    f"  - 平均延迟: {best_result['avg_delay']:.2f}ms",
+                    f"  - 执行时间: {best_result['execution_time']:.2f}s",
+                    "",
+                ])
+
+        lines.extend([
+            "💡 参数调优建议:",
+            "  1. r3=50 通常是最优选择（论文验证）",
+            "  2. K=2 在性能和复杂度间取得平衡",
+            "  3. Ne_th=2 适合大多数场景",
+            "  4. 高负载场景可考虑增大Ne_th值",
+            "=" * 60,
+        ])
+        # 整段总结一次写出
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def run_full_analysis(self, fixture=None):
+        """运行完整参数分析
+
+        Args:
+            fixture: 可选的 (拓扑, 流量需求)，传入时跳过测试环境构建
+        """
         print("🚀 LDMR参数敏感性分析")
         print("=" * 60)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # 创建测试环境
-        topology, demands = self.create_test_setup()
+        if fixture is not None:
+            topology, demands = fixture
+        else:
+            topology, demands = self.create_test_setup()
 
         # 分析各个参数
         param_results = {}
@@ -215,14 +339,21 @@ class ParameterAnalysis:
         # 显示总结
         self.display_parameter_summary(param_results)
 
+        # 全部参数都失败时没有可导出的数据，跳过导出和绘图
+        if all(best_value is None for best_value, _ in param_results.values()):
+            print("⚠️  所有参数分析均失败，跳过结果导出")
+            return param_results
+
         # 导出结果
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # 导出与绘图模块（绘图依赖matplotlib）在用到时才导入，避免拖慢启动
+            from output.result_exporter import export_parameter_analysis
 
             # 导出参数分析数据
             csv_path = export_parameter_analysis(param_results, timestamp)
 
             # 生成敏感性图表
+            from output.visualizer import plot_parameter_sensitivity
             chart_path = plot_parameter_sensitivity(param_results, timestamp)
 
             print(f"\n📊 参数分析结果已保存:")
@@ -242,8 +373,9 @@ def main():
     # 加载基础配置
     config = load_config()
 
-    # 运行参数分析
-    analyzer = ParameterAnalysis(config)
+    # 运行参数分析；--quiet 或 LDMR_QUIET=1 时每个取值只输出一行结果
+    quiet = '--quiet' in sys.argv[1:] or os.environ.get('LDMR_QUIET') == '1'
+    analyzer = ParameterAnalysis(config, quiet=quiet)
     results = analyzer.run_full_analysis()
 
     print("\n✅ 参数分析完成!")
@@ -6,6 +6,7 @@
 from .spf_algorithm import SPFAlgorithm
 from .ecmp_algorithm import ECMPAlgorithm
 from .baseline_interface import BaselineAlgorithm, AlgorithmResult
-from .benchmark_manager import BenchmarkManager, run_quick_benchmark
+from .benchmark_manager import BenchmarkManager, run_quick_benchmark, load_benchmark_results
 
-__all__ = ['SPFAlgorithm', 'ECMPAlgorithm', 'BaselineAlgorithm', 'AlgorithmResult', 'BenchmarkManager', 'run_quick_benchmark']
+__all__ = ['SPFAlgorithm', 'ECMPAlgorithm', 'BaselineAlgorithm', 'AlgorithmResult', 'BenchmarkManager', 'run_quick_benchmark',
+           'load_benchmark_results']
@@ -3,10 +3,15 @@
 管理多算法对比测试
 """
 
+import os
+import json
 import time
+import pickle
 import numpy as np
 from typing import List, Dict, Any, Tuple
 from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import sys
 
 # 添加路径
@@ -21,6 +26,32 @@ from algorithms.baseline.spf_algorithm import SPFAlgorithm
 from algorithms.baseline.ecmp_algorithm import ECMPAlgorithm
 from algorithms.baseline.baseline_interface import AlgorithmResult
 
+# 可选：orjson为C实现，序列化结果字典明显快于标准库json；未安装时回退
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj):
+    """JSON序列化回调: numpy标量/数组转为原生数值，其余对象退化为字符串"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def _dumps_json(obj, pretty: bool = True) -> str:
+    """序列化为JSON字符串，优先使用orjson；pretty=False 时输出无缩进的紧凑格式"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=_json_default, option=option).decode('utf-8')
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_json_default)
+
 
 class BenchmarkManager:
     """基准测试管理器"""
@@ -82,7 +113,7 @@ class BenchmarkManager:
         algorithm = self.algorithms[algorithm_name]
         
         print(f"🔄 运行 {algorithm_name} 算法...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if algorithm_name == 'LDMR':
             # LDMR算法特殊处理
@@ -92,7 +123,7 @@ class BenchmarkManager:
             # 基准算法
             results = algorithm.run_algorithm(topology, traffic_demands)
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
         # 计算性能指标
         metrics = self._calculate_metrics(results, algorithm_name, execution_time)
@@ -104,8 +135,13 @@ class BenchmarkManager:
     
     def run_benchmark(self, topology: NetworkTopology, 
                      traffic_demands: List[TrafficDemand],
-                     algorithms: List[str] = None) -> Dict[str, Any]:
-        """运行基准测试"""
+                     algorithms: List[str] = None,
+                     parallel: bool = True) -> Dict[str, Any]:
+        """运行基准测试
+
+        各算法互不共享状态，默认在独立进程中并发运行；
+        并发时算法实例的内部状态（如LDMR执行统计）只在子进程中更新
+        """
         if algorithms is None:
             algorithms = list(self.algorithms.keys())
         
@@ -113,24 +149,44 @@ class BenchmarkManager:
         print(f"   算法: {', '.join(algorithms)}")
         print(f"   流量需求: {len(traffic_demands)} 个")
         
+        outcomes = {}
+        
+        max_workers = min(len(algorithms), os.cpu_count() or 1)
+        # 单核环境下进程池只增加序列化和进程启动开销，直接顺序运行
+        if parallel and max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self.run_single_algorithm, name, topology, traffic_demands): name
+                           for name in algorithms}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        outcomes[name] = future.result()
+                    except Exception as e:
+                        outcomes[name] = e
+        else:
+            for algorithm_name in algorithms:
+                try:
+                    outcomes[algorithm_name] = self.run_single_algorithm(
+                        algorithm_name, topology, traffic_demands)
+                except Exception as e:
+                    outcomes[algorithm_name] = e
+        
+        # 按请求的算法顺序整理结果
         benchmark_results = {}
-        
         for algorithm_name in algorithms:
-            try:
-                results, metrics = self.run_single_algorithm(
-                    algorithm_name, topology, traffic_demands)
-                
-                benchmark_results[algorithm_name] = {
-                    'results': results,
-                    'metrics': metrics
-                }
-                
-            except Exception as e:
-                print(f"❌ {algorithm_name} 执行失败: {e}")
+            outcome = outcomes[algorithm_name]
+            if isinstance(outcome, Exception):
+                print(f"❌ {algorithm_name} 执行失败: {outcome}")
                 benchmark_results[algorithm_name] = {
                     'results': [],
                     'metrics': {},
-                    'error': str(e)
+                    'error': str(outcome)
+                }
+            else:
+                results, metrics = outcome
+                benchmark_results[algorithm_name] = {
+                    'results': results,
+                    'metrics': metrics
                 }
         
         print(f"✅ 基准测试完成")
@@ -154,30 +210,33 @@ class BenchmarkManager:
         }
         
         if successful_results:
-            # 路径统计
-            all_paths = []
-            for result in successful_results:
-                all_paths.extend(result.paths)
-            
-            if all_paths:
+            # 路径统计：先计数再用 np.fromiter 一次性填充数组，聚合在NumPy中完成
+            total_paths = sum(len(r.paths) for r in successful_results)
+            if total_paths:
+                path_lengths = np.fromiter((p.length for r in successful_results for p in r.paths),
+                                           dtype=np.int64, count=total_paths)
+                path_delays = np.fromiter((p.total_delay for r in successful_results for p in r.paths),
+                                          dtype=np.float64, count=total_paths)
                 metrics.update({
-                    'total_paths': len(all_paths),
-                    'avg_paths_per_demand': len(all_paths) / len(successful_results),
-                    'avg_path_length': np.mean([p.length for p in all_paths]),
-                    'min_path_length': min(p.length for p in all_paths),
-                    'max_path_length': max(p.length for p in all_paths),
-                    'avg_path_delay': np.mean([p.total_delay for p in all_paths]),
-                    'min_path_delay': min(p.total_delay for p in all_paths),
-                    'max_path_delay': max(p.total_delay for p in all_paths),
+                    'total_paths': total_paths,
+                    'avg_paths_per_demand': total_paths / len(successful_results),
+                    'avg_path_length': float(path_lengths.mean()),
+                    'min_path_length': int(path_lengths.min()),
+                    'max_path_length': int(path_lengths.max()),
+                    'avg_path_delay': float(path_delays.mean()),
+                    'min_path_delay': float(path_delays.min()),
+                    'max_path_delay': float(path_delays.max()),
                 })
             
             # 计算时间统计
-            computation_times = [r.computation_time for r in results if r.computation_time > 0]
-            if computation_times:
+            computation_times = np.fromiter((r.computation_time for r in results),
+                                            dtype=np.float64, count=len(results))
+            computation_times = computation_times[computation_times > 0]
+            if computation_times.size:
                 metrics.update({
-                    'avg_computation_time': np.mean(computation_times),
-                    'total_computation_time': sum(computation_times),
-                    'max_computation_time': max(computation_times),
+                    'avg_computation_time': float(computation_times.mean()),
+                    'total_computation_time': float(computation_times.sum()),
+                    'max_computation_time': float(computation_times.max()),
                 })
         
         return metrics
@@ -250,39 +309,40 @@ class BenchmarkManager:
         
         return report
     
-    def save_results(self, benchmark_results: Dict[str, Any], output_dir: str = "results"):
-        """保存基准测试结果"""
-        import json
-        import os
-        from datetime import datetime
-        
-        # 确保输出目录存在
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # 生成文件名
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # 保存详细结果
-        results_file = os.path.join(output_dir, f"benchmark_results_{timestamp}.json")
-        
-        # 清理结果以便JSON序列化
-        clean_results = {}
-        for algo_name, data in benchmark_results.items():
-            clean_results[algo_name] = {
-                'metrics': data['metrics'],
-                'error': data.get('error', None)
-            }
-        
+    def save_results(self, benchmark_results: Dict[str, Any], output_dir: str = "results",
+                     pretty: bool = True):
+        """保存基准测试结果
+
+        Args:
+            pretty: JSON结果是否缩进排版；仅供程序读取的中间结果可传 False 输出紧凑格式
+        """
+        # 确保输出目录存在，三个文件共用同一目录和时间戳后缀
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        suffix = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_file = out_dir / f"benchmark_results_{suffix}.json"
+        table_file = out_dir / f"benchmark_table_{suffix}.txt"
+        report_file = out_dir / f"benchmark_report_{suffix}.txt"
+        
+        # 保存详细结果: 逐个算法序列化后直接写入文件，不再先构造完整的清理副本
         with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump(clean_results, f, indent=2, ensure_ascii=False, default=str)
+            f.write('{')
+            for i, (algo_name, data) in enumerate(benchmark_results.items()):
+                entry = _dumps_json({'metrics': data['metrics'], 'error': data.get('error', None)}, pretty)
+                key = json.dumps(algo_name, ensure_ascii=False)
+                if pretty:
+                    # 嵌套一层，条目内每行再缩进2个空格
+                    entry = entry.replace('\n', '\n  ')
+                    f.write(f'{"," if i else ""}\n  {key}: {entry}')
+                else:
+                    f.write(f'{"," if i else ""}{key}:{entry}')
+            f.write('\n}' if pretty and benchmark_results else '}')
         
         # 保存对比表格
-        table_file = os.path.join(output_dir, f"benchmark_table_{timestamp}.txt")
         with open(table_file, 'w', encoding='utf-8') as f:
             f.write(self.generate_comparison_table(benchmark_results))
         
         # 保存详细报告
-        report_file = os.path.join(output_dir, f"benchmark_report_{timestamp}.txt")
         with open(report_file, 'w', encoding='utf-8') as f:
             f.write(self.generate_detailed_report(benchmark_results))
         
@@ -291,7 +351,7 @@ class BenchmarkManager:
         print(f"   对比表格: {table_file}")
         print(f"   详细报告: {report_file}")
         
-        return results_file, table_file, report_file
+        return str(results_file), str(table_file), str(report_file)
 
 
 def run_quick_benchmark(topology: NetworkTopology, traffic_demands: List[TrafficDemand],
@@ -304,3 +364,34 @@ def run_quick_benchmark(topology: NetworkTopology, traffic_demands: List[Traffic
     print("\n" + manager.generate_comparison_table(results))
     
     return results
+
+
+def load_benchmark_results(filepath: str, use_cache: bool = True) -> Dict[str, Any]:
+    """读取 save_results 保存的JSON结果，优先使用orjson解析
+
+    解析结果以pickle缓存在同目录的 <文件名>.pkl 中，JSON未被修改时重复读取直接加载缓存；
+    use_cache=False 时总是重新解析且不写缓存
+    """
+    json_path = Path(filepath)
+    cache_file = json_path.with_name(json_path.name + '.pkl')
+    if use_cache and cache_file.exists() and cache_file.stat().st_mtime >= json_path.stat().st_mtime:
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"⚠️  结果缓存读取失败，重新解析: {e}")
+
+    if ORJSON_AVAILABLE:
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    if use_cache:
+        try:
+            with open(cache_file, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"⚠️  结果缓存写入失败: {e}")
+    return data
@@ -43,19 +43,23 @@ class ECMPAlgorithm(BaselineAlgorithm):
     def calculate_paths_for_demand(self, topology: NetworkTopology, 
                                   demand: TrafficDemand) -> AlgorithmResult:
         """为单个流量需求计算等价多路径"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # 使用Dijkstra算法计算K条最短路径
-            path_finder = DijkstraPathFinder(topology)
-            k_paths = path_finder.find_k_shortest_paths(
-                demand.source_id, 
-                demand.destination_id, 
-                k=self.max_paths,
-                weight_type=self.weight_type
-            )
+            # 使用Dijkstra算法计算K条最短路径，相同节点对复用缓存结果
+            path_cache = self._get_path_cache(topology)
+            node_pair = (demand.source_id, demand.destination_id)
+            if node_pair not in path_cache:
+                path_finder = self._get_path_finder(topology)
+                path_cache[node_pair] = path_finder.find_k_shortest_paths(
+                    demand.source_id, 
+                    demand.destination_id, 
+                    k=self.max_paths,
+                    weight_type=self.weight_type
+                )
+            k_paths = path_cache[node_pair]
             
-            computation_time = time.time() - start_time
+            computation_time = time.perf_counter() - start_time
             
             if k_paths:
                 # 筛选等价路径
@@ -88,7 +92,7 @@ class ECMPAlgorithm(BaselineAlgorithm):
                 )
                 
         except Exception as e:
-            computation_time = time.time() - start_time
+            computation_time = time.perf_counter() - start_time
             return AlgorithmResult(
                 algorithm_name=self.name,
                 demand=demand,
@@ -4,7 +4,8 @@ SPF (Shortest Path First) 算法实现
 """
 
 import time
-from typing import List, Dict
+from collections import defaultdict
+from typing import List, Dict, Optional
 
 try:
     from topology.topology_base import NetworkTopology
@@ -37,22 +38,47 @@ class SPFAlgorithm(BaselineAlgorithm):
         super().__init__(config)
         self.name = "SPF"
         self.weight_type = config.get('weight_type', 'delay') if config else 'delay'
+        # 源节点 -> 本次运行中该源节点的全部目的节点，用于单源批量计算
+        self._destinations_by_source: Dict[str, List[str]] = {}
         
+    def run_algorithm(self, topology: NetworkTopology, 
+                     traffic_demands: List[TrafficDemand]) -> List[AlgorithmResult]:
+        """按源节点分组需求后运行，同一源节点只做一次单源Dijkstra"""
+        destinations_by_source = defaultdict(list)
+        for demand in traffic_demands:
+            destinations_by_source[demand.source_id].append(demand.destination_id)
+        self._destinations_by_source = destinations_by_source
+        try:
+            return super().run_algorithm(topology, traffic_demands)
+        finally:
+            self._destinations_by_source = {}
+    
+    def run_multi_dst(self, topology: NetworkTopology, source: str,
+                      destinations: List[str]) -> Dict[str, Optional[PathInfo]]:
+        """一次单源Dijkstra计算源节点到多个目的节点的最短路径"""
+        path_finder = self._get_path_finder(topology)
+        return path_finder.find_shortest_paths_from(
+            source, list(dict.fromkeys(destinations)), weight_type=self.weight_type)
+    
     def calculate_paths_for_demand(self, topology: NetworkTopology, 
                                   demand: TrafficDemand) -> AlgorithmResult:
         """为单个流量需求计算最短路径"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # 使用Dijkstra算法计算最短路径
-            path_finder = DijkstraPathFinder(topology)
-            path = path_finder.find_shortest_path(
-                demand.source_id, 
-                demand.destination_id, 
-                weight_type=self.weight_type
-            )
+            # 使用Dijkstra算法计算最短路径，相同节点对复用缓存结果
+            path_cache = self._get_path_cache(topology)
+            node_pair = (demand.source_id, demand.destination_id)
+            if node_pair not in path_cache:
+                # 一次算出该源节点到本次运行所有目的节点的路径
+                destinations = self._destinations_by_source.get(demand.source_id, [])
+                paths_by_dst = self.run_multi_dst(
+                    topology, demand.source_id, destinations + [demand.destination_id])
+                for destination, dst_path in paths_by_dst.items():
+                    path_cache[(demand.source_id, destination)] = dst_path
+            path = path_cache[node_pair]
             
-            computation_time = time.time() - start_time
+            computation_time = time.perf_counter() - start_time
             
             if path:
                 return AlgorithmResult(
@@ -78,7 +104,7 @@ class SPFAlgorithm(BaselineAlgorithm):
                 )
                 
         except Exception as e:
-            computation_time = time.time() - start_time
+            computation_time = time.perf_counter() - start_time
             return AlgorithmResult(
                 algorithm_name=self.name,
                 demand=demand,
@@ -22,6 +22,14 @@ except ImportError:
     except ImportError:
         from topology_base import NetworkTopology, Node, Link
 
+try:
+    from algorithms.jit_kernels import NUMBA_AVAILABLE, dijkstra_csr_into, dijkstra_csr_multi
+except ImportError:
+    try:
+        from .jit_kernels import NUMBA_AVAILABLE, dijkstra_csr_into, dijkstra_csr_multi
+    except ImportError:
+        from jit_kernels import NUMBA_AVAILABLE, dijkstra_csr_into, dijkstra_csr_multi
+
 
 @dataclass
 class PathInfo:
@@ -50,6 +58,20 @@ class DijkstraPathFinder:
 
     def __init__(self, topology: NetworkTopology):
         self.topology = topology
+        # JIT内核的临时数组，同一查找器的多次查询复用，拓扑规模变化时重新分配
+        self._scratch = None
+
+    def _get_scratch(self, num_nodes: int, num_edges: int):
+        """获取 (dist, pred, visited, heap_dist, heap_node) 临时数组"""
+        scratch = self._scratch
+        if scratch is None or len(scratch[0]) != num_nodes or len(scratch[3]) != num_edges + 1:
+            scratch = (np.empty(num_nodes, dtype=np.float64),
+                       np.empty(num_nodes, dtype=np.int64),
+                       np.empty(num_nodes, dtype=np.bool_),
+                       np.empty(num_edges + 1, dtype=np.float64),
+                       np.empty(num_edges + 1, dtype=np.int64))
+            self._scratch = scratch
+        return scratch
 
     def find_shortest_path(self, source: str, destination: str,
                            weight_type: str = 'delay',
@@ -74,6 +96,9 @@ class DijkstraPathFinder:
 
         excluded_links = excluded_links or set()
 
+        if NUMBA_AVAILABLE:
+            return self._find_shortest_path_csr(source, destination, weight_type, excluded_links)
+
         # 初始化距离和前驱
         distances = {node_id: float('inf') for node_id in self.topology.nodes}
         predecessors = {node_id: None for node_id in self.topology.nodes}
@@ -135,6 +160,121 @@ class DijkstraPathFinder:
 
         return self._create_path_info(path)
 
+    def find_shortest_paths_from(self, source: str, destinations: List[str],
+                                 weight_type: str = 'delay') -> Dict[str, Optional[PathInfo]]:
+        """
+        一次单源Dijkstra求出源节点到多个目标节点的最短路径
+
+        Args:
+            source: 源节点ID
+            destinations: 目标节点ID列表
+            weight_type: 权重类型 ('delay', 'weight', 'hops')
+
+        Returns:
+            Dict[str, Optional[PathInfo]]: 目标节点ID -> 路径信息，不可达为None
+        """
+        if not NUMBA_AVAILABLE or source not in self.topology.nodes:
+            return {destination: self.find_shortest_path(source, destination, weight_type)
+                    for destination in destinations}
+
+        node_ids, node_index, indptr, indices, edge_links = self.topology.get_csr_structure()
+        weights = self._csr_weights(edge_links, weight_type, set())
+        dist, pred = dijkstra_csr_into(indptr, indices, weights, node_index[source], -1,
+                                       *self._get_scratch(len(node_ids), len(indices)))
+
+        paths = {}
+        for destination in destinations:
+            if destination not in node_index:
+                paths[destination] = None
+            elif destination == source:
+                paths[destination] = PathInfo([source], [], 0.0, 0.0, float('inf'))
+            elif dist[node_index[destination]] == np.inf:
+                paths[destination] = None
+            else:
+                paths[destination] = self._create_path_info(
+                    self._csr_node_path(node_ids, pred, node_index[destination]))
+        return paths
+
+    def find_shortest_paths_for_pairs(self, node_pairs: Set[Tuple[str, str]],
+                                      weight_type: str = 'delay') -> Dict[Tuple[str, str], Optional[PathInfo]]:
+        """
+        批量计算多个节点对的最短路径
+
+        按源节点分组，权重只收集一次，全部源节点在一次JIT内核调用中完成；
+        numba不可用时逐对调用 find_shortest_path
+
+        Returns:
+            Dict[Tuple[str, str], Optional[PathInfo]]: 节点对 -> 路径信息，不可达为None
+        """
+        if not NUMBA_AVAILABLE:
+            return {(source, destination): self.find_shortest_path(source, destination, weight_type)
+                    for source, destination in node_pairs}
+
+        node_ids, node_index, indptr, indices, edge_links = self.topology.get_csr_structure()
+        sources = sorted({source for source, _ in node_pairs if source in node_index})
+        source_row = {source: i for i, source in enumerate(sources)}
+        if sources:
+            weights = self._csr_weights(edge_links, weight_type, set())
+            dist, pred = dijkstra_csr_multi(indptr, indices, weights,
+                                            np.array([node_index[s] for s in sources], dtype=np.int64))
+
+        paths = {}
+        for source, destination in node_pairs:
+            if source not in node_index or destination not in node_index:
+                paths[(source, destination)] = None
+            elif source == destination:
+                paths[(source, destination)] = PathInfo([source], [], 0.0, 0.0, float('inf'))
+            else:
+                row = source_row[source]
+                target = node_index[destination]
+                if dist[row, target] == np.inf:
+                    paths[(source, destination)] = None
+                else:
+                    paths[(source, destination)] = self._create_path_info(
+                        self._csr_node_path(node_ids, pred[row], target))
+        return paths
+
+    def _find_shortest_path_csr(self, source: str, destination: str, weight_type: str,
+                                excluded_links: Set[Tuple[str, str]]) -> Optional[PathInfo]:
+        """在拓扑的CSR结构上调用JIT编译的Dijkstra内核"""
+        node_ids, node_index, indptr, indices, edge_links = self.topology.get_csr_structure()
+        weights = self._csr_weights(edge_links, weight_type, excluded_links)
+
+        target = node_index[destination]
+        dist, pred = dijkstra_csr_into(indptr, indices, weights, node_index[source], target,
+                                       *self._get_scratch(len(node_ids), len(indices)))
+        if dist[target] == np.inf:
+            return None
+
+        return self._create_path_info(self._csr_node_path(node_ids, pred, target))
+
+    @staticmethod
+    def _csr_weights(edge_links: List[Link], weight_type: str,
+                     excluded_links: Set[Tuple[str, str]]) -> np.ndarray:
+        """按CSR边顺序收集权重，排除或未激活的链路置为inf"""
+        # 权重每次从链路对象读取
+        if weight_type == 'weight':
+            edge_weights = (link.weight for link in edge_links)
+        elif weight_type == 'hops':
+            edge_weights = (1.0 for _ in edge_links)
+        else:
+            edge_weights = (link.delay for link in edge_links)
+        return np.fromiter(
+            (w if link.is_active and link.id not in excluded_links else np.inf
+             for w, link in zip(edge_weights, edge_links)),
+            dtype=np.float64, count=len(edge_links))
+
+    @staticmethod
+    def _csr_node_path(node_ids: List[str], pred: np.ndarray, target: int) -> List[str]:
+        """沿前驱数组回溯出节点ID路径"""
+        path = []
+        current = target
+        while current != -1:
+            path.append(node_ids[current])
+            current = pred[current]
+        path.reverse()
+        return path
+
     def _reconstruct_path(self, predecessors: Dict[str, str],
                           source: str, destination: str) -> Optional[List[str]]:
         """重构路径"""
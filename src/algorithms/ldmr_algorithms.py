@@ -4,7 +4,8 @@ LDMR (Link Disjoint Multipath Routing) 算法实现
 Algorithm 1 的完整实现
 """
 
-import random
+import sys
+from itertools import chain
 import numpy as np
 import time
 from typing import List, Dict, Tuple, Set, Optional
@@ -14,15 +15,18 @@ from enum import Enum
 try:
     from topology.topology_base import NetworkTopology, Link
     from algorithms.basic_algorithms import DijkstraPathFinder, PathInfo
+    from algorithms.jit_kernels import NUMBA_AVAILABLE, dijkstra_csr_into
     from traffic.traffic_model import TrafficDemand
 except ImportError:
     try:
         from ..topology.topology_base import NetworkTopology, Link
         from .basic_algorithms import DijkstraPathFinder, PathInfo
+        from .jit_kernels import NUMBA_AVAILABLE, dijkstra_csr_into
         from ..traffic.traffic_model import TrafficDemand
     except ImportError:
         from topology_base import NetworkTopology, Link
         from basic_algorithms import DijkstraPathFinder, PathInfo
+        from jit_kernels import NUMBA_AVAILABLE, dijkstra_csr_into
         from traffic_model import TrafficDemand
 
 
@@ -36,6 +40,7 @@ class LDMRConfig:
     Ne_th: int = 2  # 链路利用频次阈值
     max_iterations: int = 10  # 最大迭代次数
     enable_statistics: bool = True  # 是否启用详细统计
+    seed: Optional[int] = None  # 随机权重的种子，设为整数时每次运行结果相同
 
 
 @dataclass
@@ -70,6 +75,9 @@ class MultiPathResult:
 class LDMRAlgorithm:
     """LDMR算法主类 - 实现论文Algorithm 1"""
 
+    # 逐需求进度日志的批量写出行数
+    LOG_BATCH_LINES = 1000
+
     def __init__(self, config: LDMRConfig = None):
         self.config = config or LDMRConfig()
         self.link_usage_count: Dict[Tuple[str, str], int] = {}
@@ -80,11 +88,30 @@ class LDMRAlgorithm:
             'weight_updates': 0,
             'link_removals': 0
         }
+        # CSR备用路径计算的缓存: (CSR结构, 链路ID列表, 链路ID->下标, 有向边->链路下标, 查找器,
+        # 链路使用计数数组, 未激活链路掩码)；使用计数数组与 link_usage_count 同步递增
+        self._csr_context = None
+        # 随机权重生成器 (PCG64)，每次运行开始时按 config.seed 重新创建
+        self.rng = np.random.default_rng(self.config.seed)
+
+    def reconfigure(self, config: LDMRConfig):
+        """更换算法配置并重置状态，保留已建立的CSR结构，供参数扫描复用同一实例"""
+        self.config = config
+        self.reset_algorithm_state()
 
     def reset_algorithm_state(self):
         """重置算法状态 (Algorithm 1, Steps 1-5)"""
         self.link_usage_count.clear()
         self.calculated_paths.clear()
+        self.rng = np.random.default_rng(self.config.seed)
+        # CSR结构与拓扑绑定，跨运行保留；使用计数清零，链路激活状态按当前拓扑重新读取
+        context = self._csr_context
+        if context is not None:
+            link_ids, path_finder, usage, inactive = context[1], context[4], context[5], context[6]
+            links = path_finder.topology.links
+            usage.fill(0)
+            inactive[:] = np.fromiter((not links[link_id].is_active for link_id in link_ids),
+                                      dtype=np.bool_, count=len(link_ids))
         if self.config.enable_statistics:
             self.execution_stats = {
                 'total_time': 0.0,
@@ -95,9 +122,14 @@ class LDMRAlgorithm:
 
     def increment_link_usage(self, path: PathInfo):
         """增加路径上所有链路的使用计数 (Algorithm 1, Step 10)"""
+        context = self._csr_context
         for link_tuple in path.links:
             link_id = tuple(sorted(link_tuple))
             self.link_usage_count[link_id] = self.link_usage_count.get(link_id, 0) + 1
+            if context is not None:
+                i = context[2].get(link_id)
+                if i is not None:
+                    context[5][i] += 1
 
             if self.config.enable_statistics:
                 self.execution_stats['path_calculations'] += 1
@@ -116,24 +148,17 @@ class LDMRAlgorithm:
         - 使用频次 >= Ne_th: 权重范围 [r2, r3] (较大权重，避免过度使用)
         """
         excluded_links = excluded_links or set()
-        weight_updates = {}
-
-        for link_id, link in topology.links.items():
-            # 跳过排除的链路
-            if link_id in excluded_links:
-                continue
-
-            usage_count = self.get_link_usage_count(link.node1_id, link.node2_id)
-
-            # Algorithm 1, Steps 14-18: 根据使用频次更新权重
-            if usage_count < self.config.Ne_th:
-                # 使用频次较低，分配较小权重 (r1, r2)
-                new_weight = random.randint(self.config.r1, self.config.r2)
-            else:
-                # 使用频次较高，分配较大权重 (r2, r3)
-                new_weight = random.randint(self.config.r2, self.config.r3)
-
-            weight_updates[link_id] = new_weight
+        # 跳过排除的链路
+        links = [link for link_id, link in topology.links.items() if link_id not in excluded_links]
+
+        # Algorithm 1, Steps 14-18: 根据使用频次更新权重
+        # 使用频次较低分配较小权重 [r1, r2]，较高分配较大权重 [r2, r3]，一次生成全部链路的权重
+        low_usage = np.fromiter((self.get_link_usage_count(link.node1_id, link.node2_id) < self.config.Ne_th
+                                 for link in links), dtype=np.bool_, count=len(links))
+        new_weights = self.rng.integers(np.where(low_usage, self.config.r1, self.config.r2),
+                                        np.where(low_usage, self.config.r2, self.config.r3),
+                                        endpoint=True)
+        weight_updates = dict(zip((link.id for link in links), new_weights.tolist()))
 
         # 批量更新权重
         topology.update_link_weights(weight_updates)
@@ -156,8 +181,9 @@ class LDMRAlgorithm:
 
         print(f"     计算 {len(node_pairs)} 个节点对的最短延迟路径...")
 
-        for source, destination in node_pairs:
-            path = path_finder.find_shortest_path(source, destination, weight_type='delay')
+        # 各节点对互不依赖，按源节点批量计算（一次JIT内核调用完成）
+        pair_paths = path_finder.find_shortest_paths_for_pairs(node_pairs, weight_type='delay')
+        for (source, destination), path in pair_paths.items():
             if path:
                 shortest_paths[(source, destination)] = path
                 # 更新链路使用计数 (Algorithm 1, Step 10)
@@ -171,8 +197,12 @@ class LDMRAlgorithm:
         """
         查找备用路径，排除指定链路 (Algorithm 1, Steps 23-28)
 
-        创建临时拓扑移除已使用的链路，然后在更新权重后计算路径
+        创建临时拓扑移除已使用的链路，然后在更新权重后计算路径；
+        numba可用时直接在原拓扑的CSR数组上完成，不复制拓扑
         """
+        if NUMBA_AVAILABLE:
+            return self._find_backup_path_csr(topology, source, destination, excluded_links)
+
         # 创建拓扑副本
         temp_topology = topology.copy()
 
@@ -192,6 +222,74 @@ class LDMRAlgorithm:
 
         return backup_path
 
+    def _get_csr_context(self, topology: NetworkTopology):
+        """获取拓扑CSR结构及链路下标映射，每次运行或拓扑结构变化后重新建立
+
+        链路使用计数和激活状态在建立时各取一次快照，之后使用计数由
+        increment_link_usage 增量维护，避免每次查找备用路径都遍历全部链路对象
+        """
+        csr = topology.get_csr_structure()
+        context = self._csr_context
+        if context is None or context[0] is not csr or context[4].topology is not topology:
+            edge_links = csr[4]
+            link_ids = list(topology.links.keys())
+            link_index = {link_id: i for i, link_id in enumerate(link_ids)}
+            edge_link_index = np.fromiter((link_index[link.id] for link in edge_links),
+                                          dtype=np.int64, count=len(edge_links))
+            usage = np.fromiter((self.link_usage_count.get(link_id, 0) for link_id in link_ids),
+                                dtype=np.int64, count=len(link_ids))
+            inactive = np.fromiter((not link.is_active for link in topology.links.values()),
+                                   dtype=np.bool_, count=len(link_ids))
+            context = (csr, link_ids, link_index, edge_link_index, DijkstraPathFinder(topology),
+                       usage, inactive)
+            self._csr_context = context
+        return context
+
+    def _find_backup_path_csr(self, topology: NetworkTopology,
+                              source: str, destination: str,
+                              excluded_links: Set[Tuple[str, str]]) -> Optional[PathInfo]:
+        """
+        find_backup_path_with_excluded_links 的CSR实现 (Algorithm 1, Steps 23-28)
+
+        与复制拓扑的做法等价: 排除链路和未激活链路的权重置为inf，
+        其余链路按使用频次在 [r1, r2] 或 [r2, r3] 中随机取整数权重，两个方向共用
+        """
+        ((node_ids, node_index, indptr, indices, _), link_ids, link_index, edge_link_index,
+         path_finder, usage, inactive) = self._get_csr_context(topology)
+        if source not in node_index or destination not in node_index:
+            return None
+
+        # Algorithm 1, Steps 25-26: 按使用频次为每条链路生成随机权重
+        low_usage = usage < self.config.Ne_th
+        link_weights = self.rng.integers(np.where(low_usage, self.config.r1, self.config.r2),
+                                         np.where(low_usage, self.config.r2, self.config.r3),
+                                         endpoint=True).astype(np.float64)
+        link_weights[inactive] = np.inf
+
+        # Algorithm 1, Step 24: 移除已使用的链路
+        removed = 0
+        present = 0
+        for link_id in excluded_links:
+            if len(link_id) == 2:
+                removed += 1
+                i = link_index.get(link_id)
+                if i is not None:
+                    link_weights[i] = np.inf
+                    present += 1
+
+        if self.config.enable_statistics:
+            self.execution_stats['link_removals'] += removed
+            self.execution_stats['weight_updates'] += len(link_ids) - present
+
+        # Algorithm 1, Step 27: 在更新后的权重上查找路径
+        target = node_index[destination]
+        dist, pred = dijkstra_csr_into(indptr, indices, link_weights[edge_link_index],
+                                       node_index[source], target,
+                                       *path_finder._get_scratch(len(node_ids), len(indices)))
+        if dist[target] == np.inf:
+            return None
+        return path_finder._create_path_info(path_finder._csr_node_path(node_ids, pred, target))
+
     def calculate_multipath_for_single_demand(self, topology: NetworkTopology,
                                               demand: TrafficDemand,
                                               existing_shortest_paths: Dict[
@@ -204,7 +302,7 @@ class LDMRAlgorithm:
         2. 迭代计算K-1条备用路径，每次排除之前路径使用的链路
         3. 确保所有路径都是链路不相交的
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         source, destination = demand.source_id, demand.destination_id
         paths = []
 
@@ -221,7 +319,7 @@ class LDMRAlgorithm:
                 paths.append(shortest_path)
                 self.increment_link_usage(shortest_path)
             else:
-                computation_time = time.time() - start_time
+                computation_time = time.perf_counter() - start_time
                 return MultiPathResult(source, destination, [], demand, False, computation_time)
 
         # 计算备用路径 (K-1条) (Algorithm 1, Steps 23-30)
@@ -245,7 +343,7 @@ class LDMRAlgorithm:
                 # 无法找到更多不相交路径，提前结束
                 break
 
-        computation_time = time.time() - start_time
+        computation_time = time.perf_counter() - start_time
         return MultiPathResult(source, destination, paths, demand, True, computation_time)
 
     def run_ldmr_algorithm(self, topology: NetworkTopology,
@@ -259,7 +357,7 @@ class LDMRAlgorithm:
         3. 按流量大小降序处理每个需求 (Steps 11-30)
         4. 为每个需求计算K条链路不相交路径
         """
-        algorithm_start_time = time.time()
+        algorithm_start_time = time.perf_counter()
 
         print(f"🚀 开始运行LDMR算法 (Algorithm 1)")
         print(f"     配置参数: K={self.config.K}, Ne_th={self.config.Ne_th}, r3={self.config.r3}")
@@ -267,12 +365,33 @@ class LDMRAlgorithm:
 
         # Steps 1-5: 初始化
         self.reset_algorithm_state()
-        results = []
 
-        # 初始化拓扑权重为链路延迟
-        for link in topology.links.values():
+        # 初始化拓扑权重为链路延迟；先保存原权重，结束时恢复，
+        # 使同一拓扑可在参数扫描等多次运行之间直接复用
+        links = list(topology.links.values())
+        original_weights = [link.weight for link in links]
+        for link in links:
             link.weight = link.delay
 
+        try:
+            results = self._process_demands(topology, traffic_demands)
+        finally:
+            for link, weight in zip(links, original_weights):
+                link.weight = weight
+
+        # 记录总执行时间
+        total_time = time.perf_counter() - algorithm_start_time
+        if self.config.enable_statistics:
+            self.execution_stats['total_time'] = total_time
+
+        print(f"✅ LDMR算法执行完成 (耗时: {total_time:.2f}秒)")
+        return results
+
+    def _process_demands(self, topology: NetworkTopology,
+                         traffic_demands: List[TrafficDemand]) -> List[MultiPathResult]:
+        """Algorithm 1, Steps 6-30: 计算最短延迟路径后按带宽降序为各需求计算多路径"""
+        results = []
+
         # Steps 6-10: 计算所有节点对的最短延迟路径
         print(f"     Phase 1: 计算最短延迟路径...")
         shortest_paths = self.calculate_shortest_delay_paths(topology, traffic_demands)
@@ -286,29 +405,37 @@ class LDMRAlgorithm:
             print(
                 f"     带宽范围: {sorted_demands[0].bandwidth:.1f}Mbps (最大) - {sorted_demands[-1].bandwidth:.1f}Mbps (最小)")
 
+        # 每个需求两行进度日志，先累积再按批写出，避免上万次print调用
+        log_lines = []
+        total = len(sorted_demands)
         for i, demand in enumerate(sorted_demands):
-            print(f"     处理需求 {i + 1}/{len(sorted_demands)}: "
-                  f"{demand.source_id}->{demand.destination_id} "
-                  f"({demand.bandwidth:.1f}Mbps, 优先级{demand.priority})")
+            log_lines.append(f"     处理需求 {i + 1}/{total}: "
+                             f"{demand.source_id}->{demand.destination_id} "
+                             f"({demand.bandwidth:.1f}Mbps, 优先级{demand.priority})")
 
             # 为当前流量需求计算多路径 (Steps 12-30)
             result = self.calculate_multipath_for_single_demand(topology, demand, shortest_paths)
             results.append(result)
 
             if result.success:
-                print(f"       ✅ 成功计算 {len(result.paths)} 条路径 "
-                      f"(总延迟: {result.total_delay:.1f}ms, 总跳数: {result.total_hops})")
+                log_lines.append(f"       ✅ 成功计算 {len(result.paths)} 条路径 "
+                                 f"(总延迟: {result.total_delay:.1f}ms, 总跳数: {result.total_hops})")
             else:
-                print(f"       ❌ 路径计算失败")
+                log_lines.append(f"       ❌ 路径计算失败")
 
-        # 记录总执行时间
-        total_time = time.time() - algorithm_start_time
-        if self.config.enable_statistics:
-            self.execution_stats['total_time'] = total_time
+            if len(log_lines) >= self.LOG_BATCH_LINES:
+                self._flush_log(log_lines)
+        self._flush_log(log_lines)
 
-        print(f"✅ LDMR算法执行完成 (耗时: {total_time:.2f}秒)")
         return results
 
+    @staticmethod
+    def _flush_log(log_lines: List[str]):
+        """一次写出累积的日志行并清空缓冲"""
+        if log_lines:
+            sys.stdout.write("\n".join(log_lines) + "\n")
+            log_lines.clear()
+
     def get_algorithm_statistics(self, results: List[MultiPathResult]) -> Dict:
         """获取算法执行的详细统计信息"""
         if not results:
@@ -318,14 +445,14 @@ class LDMRAlgorithm:
         successful_results = [r for r in results if r.success]
         successful_demands = len(successful_results)
 
-        # 路径统计
-        all_paths = []
-        for result in successful_results:
-            all_paths.extend(result.paths)
-
-        path_lengths = [p.length for p in all_paths]
-        path_delays = [p.total_delay for p in all_paths]
-        computation_times = [r.computation_time for r in results]
+        # 路径统计：先计数再用 np.fromiter 一次性填充数组，聚合在NumPy中完成
+        total_paths = sum(len(r.paths) for r in successful_results)
+        path_lengths = np.fromiter((p.length for r in successful_results for p in r.paths),
+                                   dtype=np.int64, count=total_paths)
+        path_delays = np.fromiter((p.total_delay for r in successful_results for p in r.paths),
+                                  dtype=np.float64, count=total_paths)
+        computation_times = np.fromiter((r.computation_time for r in results),
+                                        dtype=np.float64, count=total_demands)
 
         # 基础统计
         stats = {
@@ -333,34 +460,29 @@ class LDMRAlgorithm:
             'successful_demands': successful_demands,
             'failed_demands': total_demands - successful_demands,
             'success_rate': successful_demands / total_demands if total_demands > 0 else 0,
-            'total_paths_calculated': len(all_paths),
-            'avg_paths_per_successful_demand': len(all_paths) / successful_demands if successful_demands > 0 else 0,
+            'total_paths_calculated': total_paths,
+            'avg_paths_per_successful_demand': total_paths / successful_demands if successful_demands > 0 else 0,
         }
 
         # 路径质量统计
-        if path_lengths:
-            stats.update({
-                'avg_path_length': np.mean(path_lengths),
-                'min_path_length': min(path_lengths),
-                'max_path_length': max(path_lengths),
-                'std_path_length': np.std(path_lengths),
-            })
-
-        if path_delays:
+        if total_paths:
             stats.update({
-                'avg_path_delay': np.mean(path_delays),
-                'min_path_delay': min(path_delays),
-                'max_path_delay': max(path_delays),
-                'std_path_delay': np.std(path_delays),
+                'avg_path_length': float(path_lengths.mean()),
+                'min_path_length': int(path_lengths.min()),
+                'max_path_length': int(path_lengths.max()),
+                'std_path_length': float(path_lengths.std()),
+                'avg_path_delay': float(path_delays.mean()),
+                'min_path_delay': float(path_delays.min()),
+                'max_path_delay': float(path_delays.max()),
+                'std_path_delay': float(path_delays.std()),
             })
 
         # 性能统计
-        if computation_times:
-            stats.update({
-                'avg_computation_time': np.mean(computation_times),
-                'total_computation_time': sum(computation_times),
-                'max_computation_time': max(computation_times),
-            })
+        stats.update({
+            'avg_computation_time': float(computation_times.mean()),
+            'total_computation_time': float(computation_times.sum()),
+            'max_computation_time': float(computation_times.max()),
+        })
 
         # 链路使用统计
         if self.link_usage_count:
@@ -380,8 +502,14 @@ class LDMRAlgorithm:
 
         return stats
 
-    def verify_path_disjointness(self, results: List[MultiPathResult]) -> Dict:
-        """验证路径的链路不相交性"""
+    @staticmethod
+    def verify_path_disjointness(results: List[MultiPathResult]) -> Dict:
+        """验证路径的链路不相交性（只检查结果本身，不依赖算法实例状态）
+
+        路径节点ID的哈希一次性展开为int64数组，相邻节点哈希异或即为与方向无关的链路键；
+        按 (结果序号, 链路键) 排序后相邻重复即为疑似共享链路，
+        只对疑似冲突的结果逐条精确复核并生成冲突描述，哈希碰撞不会误判
+        """
         verification_stats = {
             'total_results_checked': len(results),
             'disjoint_results': 0,
@@ -390,47 +518,78 @@ class LDMRAlgorithm:
             'conflicts': []
         }
 
-        for result in results:
-            if not result.success or len(result.paths) < 2:
-                continue
-
-            # 检查该结果中的路径是否链路不相交
-            all_links = set()
-            is_disjoint = True
-            conflicts = []
-
-            for i, path in enumerate(result.paths):
-                for link_tuple in path.links:
-                    link_id = tuple(sorted(link_tuple))
-                    if link_id in all_links:
-                        is_disjoint = False
-                        conflicts.append(f"路径{i + 1}中的链路{link_id}与之前路径冲突")
-                    all_links.add(link_id)
-
-            if is_disjoint:
-                verification_stats['disjoint_results'] += 1
-            else:
-                verification_stats['non_disjoint_results'] += 1
+        checked = [result for result in results if result.success and len(result.paths) >= 2]
+        if not checked:
+            return verification_stats
+
+        paths = [path for result in checked for path in result.paths]
+        node_hashes = np.fromiter(map(hash, chain.from_iterable(path.nodes for path in paths)),
+                                  dtype=np.int64)
+        nodes_per_path = np.fromiter(map(len, (path.nodes for path in paths)),
+                                     dtype=np.int64, count=len(paths))
+        paths_per_result = np.fromiter(map(len, (result.paths for result in checked)),
+                                       dtype=np.int64, count=len(checked))
+        owners = np.repeat(np.repeat(np.arange(len(checked), dtype=np.int64), paths_per_result),
+                           nodes_per_path)
+
+        # 第j个键对应节点j与j+1之间的链路，跨越两条路径边界的位置剔除
+        link_keys = node_hashes[1:] ^ node_hashes[:-1]
+        within_path = np.ones(len(link_keys), dtype=np.bool_)
+        within_path[np.cumsum(nodes_per_path)[:-1] - 1] = False
+        link_keys = link_keys[within_path]
+        owners = owners[:-1][within_path]
+
+        # 同一结果内出现两次的链路键排序后必然相邻
+        order = np.lexsort((link_keys, owners))
+        sorted_keys = link_keys[order]
+        sorted_owners = owners[order]
+        repeated = (sorted_keys[1:] == sorted_keys[:-1]) & (sorted_owners[1:] == sorted_owners[:-1])
+        suspects = np.unique(sorted_owners[1:][repeated])
+
+        non_disjoint = 0
+        for index in suspects.tolist():
+            conflicts = LDMRAlgorithm._path_conflicts(checked[index])
+            if conflicts:
+                non_disjoint += 1
                 verification_stats['conflicts'].extend(conflicts)
 
-        total_checked = verification_stats['disjoint_results'] + verification_stats['non_disjoint_results']
-        if total_checked > 0:
-            verification_stats['disjoint_rate'] = verification_stats['disjoint_results'] / total_checked
+        verification_stats['non_disjoint_results'] = non_disjoint
+        verification_stats['disjoint_results'] = len(checked) - non_disjoint
+        verification_stats['disjoint_rate'] = verification_stats['disjoint_results'] / len(checked)
 
         return verification_stats
 
+    @staticmethod
+    def _path_conflicts(result: MultiPathResult) -> List[str]:
+        """列出单个结果中与之前路径重复使用的链路"""
+        all_links = set()
+        conflicts = []
+        for i, path in enumerate(result.paths):
+            for link_tuple in path.links:
+                link_id = tuple(sorted(link_tuple))
+                if link_id in all_links:
+                    conflicts.append(f"路径{i + 1}中的链路{link_id}与之前路径冲突")
+                all_links.add(link_id)
+        return conflicts
+
+
+# 各场景的LDMR参数预设；只保存参数，每次调用构造新的配置对象
+_SCENARIO_CONFIG_PRESETS = {
+    'testing': dict(K=2, r1=1, r2=5, r3=20, Ne_th=1),
+    'light_load': dict(K=2, r1=1, r2=10, r3=30, Ne_th=2),
+    'heavy_load': dict(K=2, r1=1, r2=10, r3=50, Ne_th=3),
+    'high_reliability': dict(K=3, r1=1, r2=15, r3=60, Ne_th=2),
+    'performance': dict(K=2, r1=1, r2=10, r3=50, Ne_th=2, enable_statistics=True),
+}
+
 
 def create_ldmr_config_for_scenario(scenario: str) -> LDMRConfig:
-    """为不同场景创建LDMR配置"""
-    configs = {
-        'testing': LDMRConfig(K=2, r1=1, r2=5, r3=20, Ne_th=1),
-        'light_load': LDMRConfig(K=2, r1=1, r2=10, r3=30, Ne_th=2),
-        'heavy_load': LDMRConfig(K=2, r1=1, r2=10, r3=50, Ne_th=3),
-        'high_reliability': LDMRConfig(K=3, r1=1, r2=15, r3=60, Ne_th=2),
-        'performance': LDMRConfig(K=2, r1=1, r2=10, r3=50, Ne_th=2, enable_statistics=True)
-    }
-
-    return configs.get(scenario, LDMRConfig())
+    """为不同场景创建LDMR配置
+
+    LDMRConfig 可变（参数分析会直接修改字段），因此不缓存实例，
+    只构造所请求场景的一个对象，而不是每次构造全部五个
+    """
+    return LDMRConfig(**_SCENARIO_CONFIG_PRESETS.get(scenario, {}))
 
 
 def run_ldmr_simulation(topology: NetworkTopology,
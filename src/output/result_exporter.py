@@ -7,6 +7,7 @@
 import os
 import csv
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -161,9 +162,9 @@ class ResultExporter:
                         f"{metrics.get('avg_path_length', 0):.2f}",
                         metrics.get('min_path_length', 0),
                         metrics.get('max_path_length', 0),
-                        f"{metrics.get('avg_path_delay', 0) * 1000:.4f}",  # 转换为毫秒
-                        f"{metrics.get('min_path_delay', 0) * 1000:.4f}",
-                        f"{metrics.get('max_path_delay', 0) * 1000:.4f}",
+                        f"{metrics.get('avg_path_delay', 0):.4f}",
+                        f"{metrics.get('min_path_delay', 0):.4f}",
+                        f"{metrics.get('max_path_delay', 0):.4f}",
                         f"{metrics.get('execution_time', 0):.2f}",
                         f"{metrics.get('avg_computation_time', 0) * 1000:.4f}",
                         f"{metrics.get('disjoint_rate', 0):.4f}"
@@ -257,7 +258,7 @@ class ResultExporter:
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write("LDMR算法实验摘要报告\n")
             f.write("=" * 60 + "\n")
-            f.write(f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(f"生成时间: {datetime.now().isoformat(sep=' ', timespec='seconds')}\n\n")
 
             # 实验配置信息
             if config:
@@ -310,7 +311,7 @@ class ResultExporter:
                         metrics = data.get('metrics', {})
                         f.write(f"{algo_name}:\n")
                         f.write(f"  成功率: {metrics.get('success_rate', 0) * 100:.2f}%\n")
-                        f.write(f"  平均延迟: {metrics.get('avg_path_delay', 0) * 1000:.4f} ms\n")
+                        f.write(f"  平均延迟: {metrics.get('avg_path_delay', 0):.4f} ms\n")
                         f.write(f"  执行时间: {metrics.get('execution_time', 0):.2f} s\n")
                     else:
                         f.write(f"{algo_name}: 执行失败\n")
@@ -388,35 +389,44 @@ def export_all_results(ldmr_results: List[MultiPathResult] = None,
                        benchmark_results: Dict[str, Any] = None,
                        param_results: Dict[str, Any] = None,
                        config: Dict[str, Any] = None,
-                       output_dir: str = "results") -> Dict[str, str]:
+                       output_dir: str = "results",
+                       timestamp: str = None) -> Dict[str, str]:
     """
     一次性导出所有结果的便捷函数
 
+    Args:
+        timestamp: 文件名时间戳，调用方可传入与图表共用的同一时间戳
+
     Returns:
         Dict[str, str]: 各个输出文件的路径
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     exporter = ResultExporter(output_dir)
 
-    output_files = {}
-
     print("🚀 开始导出所有实验结果...")
 
-    if ldmr_results:
-        output_files['ldmr_csv'] = exporter.export_ldmr_results(
-            ldmr_results, config or {}, timestamp)
+    # 各文件相互独立，在线程池中并发写出以重叠磁盘I/O延迟
+    with ThreadPoolExecutor(max_workers=4) as io_pool:
+        futures = {}
+        if ldmr_results:
+            futures['ldmr_csv'] = io_pool.submit(
+                exporter.export_ldmr_results, ldmr_results, config or {}, timestamp)
 
-    if benchmark_results:
-        output_files['benchmark_csv'] = exporter.export_benchmark_comparison(
-            benchmark_results, timestamp)
+        if benchmark_results:
+            futures['benchmark_csv'] = io_pool.submit(
+                exporter.export_benchmark_comparison, benchmark_results, timestamp)
 
-    if param_results:
-        output_files['parameter_csv'] = exporter.export_parameter_analysis(
-            param_results, timestamp)
+        if param_results:
+            futures['parameter_csv'] = io_pool.submit(
+                exporter.export_parameter_analysis, param_results, timestamp)
 
-    # 总是生成摘要报告
-    output_files['summary_txt'] = exporter.generate_summary_report(
-        ldmr_results, benchmark_results, param_results, config, timestamp)
+        # 总是生成摘要报告
+        futures['summary_txt'] = io_pool.submit(
+            exporter.generate_summary_report,
+            ldmr_results, benchmark_results, param_results, config, timestamp)
+
+        output_files = {file_type: future.result() for file_type, future in futures.items()}
 
     print("✅ 所有结果导出完成!")
     print("📁 输出文件:")
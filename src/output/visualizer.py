@@ -6,6 +6,9 @@
 
 import os
 import numpy as np
+import matplotlib
+# 图表只保存为文件，使用无界面的Agg后端，避免初始化Tk/Qt等GUI工具包
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
@@ -21,10 +24,12 @@ sns.set_palette("husl")
 try:
     from algorithms.ldmr_algorithms import MultiPathResult
     from algorithms.baseline.baseline_interface import AlgorithmResult
+    from algorithms.jit_kernels import jain_fairness_index
 except ImportError:
     try:
         from ..algorithms.ldmr_algorithms import MultiPathResult
         from ..algorithms.baseline.baseline_interface import AlgorithmResult
+        from ..algorithms.jit_kernels import jain_fairness_index
     except ImportError:
         # 占位符，实际运行时会正确导入
         pass
@@ -43,7 +48,8 @@ class Visualizer:
 
         # 设置图表默认参数
         self.figure_size = (12, 8)
-        self.dpi = 300
+        # 15x12英寸的图在150dpi下已足够清晰，像素数只有300dpi的四分之一，PNG编码更快、文件更小
+        self.dpi = 150
         self.colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#1B998B', '#8E6C8A']
 
     def _save_figure(self, fig, filename: str, tight_layout: bool = True) -> str:
@@ -87,7 +93,7 @@ class Visualizer:
                 metrics = data.get('metrics', {})
                 algorithms.append(algo_name)
                 success_rates.append(metrics.get('success_rate', 0) * 100)
-                avg_delays.append(metrics.get('avg_path_delay', 0) * 1000)  # 转换为ms
+                avg_delays.append(metrics.get('avg_path_delay', 0))
                 avg_paths.append(metrics.get('avg_paths_per_demand', 0))
                 exec_times.append(metrics.get('execution_time', 0))
 
@@ -95,50 +101,25 @@ class Visualizer:
             print("❌ 没有有效的算法对比数据")
             return ""
 
-        # 创建2x2子图
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-
-        # 1. 成功率对比
-        bars1 = ax1.bar(algorithms, success_rates, color=self.colors[:len(algorithms)])
-        ax1.set_title('Comparison of Success Rates', fontsize=14, fontweight='bold')
-        ax1.set_ylabel('Success Rate (%)')
-        ax1.set_ylim(0, 105)
-
-        # 添加数值标签
-        for bar, rate in zip(bars1, success_rates):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width() / 2., height + 1,
-                     f'{rate:.1f}%', ha='center', va='bottom')
-
-        # 2. 平均延迟对比
-        bars2 = ax2.bar(algorithms, avg_delays, color=self.colors[:len(algorithms)])
-        ax2.set_title('Comparison of Average Latency', fontsize=14, fontweight='bold')
-        ax2.set_ylabel('Average Latency (ms)')
+        # 四项指标组成 (4, 算法数) 数组，每个子图一行
+        values = np.array([success_rates, avg_delays, avg_paths, exec_times], dtype=np.float64)
+        panels = [
+            ('Comparison of Success Rates', 'Success Rate (%)', '%.1f%%'),
+            ('Comparison of Average Latency', 'Average Latency (ms)', '%.3f'),
+            ('Comparison of Average Number of Paths', 'Average Number of Paths', '%.1f'),
+            ('Comparison of Execution Time', 'Execution Time (s)', '%.2f'),
+        ]
 
-        for bar, delay in zip(bars2, avg_delays):
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width() / 2., height,
-                     f'{delay:.3f}', ha='center', va='bottom')
-
-        # 3. 平均路径数对比
-        bars3 = ax3.bar(algorithms, avg_paths, color=self.colors[:len(algorithms)])
-        ax3.set_title('Comparison of Average Number of Paths', fontsize=14, fontweight='bold')
-        ax3.set_ylabel('Average Number of Paths')
-
-        for bar, paths in zip(bars3, avg_paths):
-            height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width() / 2., height,
-                     f'{paths:.1f}', ha='center', va='bottom')
-
-        # 4. 执行时间对比
-        bars4 = ax4.bar(algorithms, exec_times, color=self.colors[:len(algorithms)])
-        ax4.set_title('Comparison of Execution Time', fontsize=14, fontweight='bold')
-        ax4.set_ylabel('Execution Time (s)')
-
-        for bar, time in zip(bars4, exec_times):
-            height = bar.get_height()
-            ax4.text(bar.get_x() + bar.get_width() / 2., height,
-                     f'{time:.2f}', ha='center', va='bottom')
+        # 创建2x2子图
+        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        colors = self.colors[:len(algorithms)]
+        for ax, row, (title, ylabel, fmt) in zip(axes.flat, values, panels):
+            bars = ax.bar(algorithms, row, color=colors)
+            ax.set_title(title, fontsize=14, fontweight='bold')
+            ax.set_ylabel(ylabel)
+            # 添加数值标签
+            ax.bar_label(bars, fmt=fmt, padding=2)
+        axes[0, 0].set_ylim(0, 105)
 
         # 调整布局
         plt.suptitle('Performance Comparison between LDMR and Benchmark Algorithms', fontsize=16, fontweight='bold', y=0.98)
@@ -300,22 +281,15 @@ class Visualizer:
         ax1.set_ylabel('Success Rate (%)')
         ax1.set_ylim(0, 105)
 
-        for bar, rate in zip(bars1, range_success_rates):
-            if rate > 0:
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width() / 2., height + 1,
-                         f'{rate:.1f}%', ha='center', va='bottom')
+        ax1.bar_label(bars1, labels=[f'{rate:.1f}%' if rate > 0 else '' for rate in range_success_rates],
+                      padding=2)
 
         # 2. 不同流量大小的平均延迟
         bars2 = ax2.bar(range_labels, range_avg_delays, color=self.colors[:4])
         ax2.set_title('Average Latency by Traffic Size', fontweight='bold')
         ax2.set_ylabel('Average Latency (ms)')
 
-        for bar, delay in zip(bars2, range_avg_delays):
-            if delay > 0:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width() / 2., height,
-                         f'{delay:.3f}', ha='center', va='bottom')
+        ax2.bar_label(bars2, labels=[f'{delay:.3f}' if delay > 0 else '' for delay in range_avg_delays])
 
         # 3. 路径数分布
         path_counts = [len(r.paths) for r in ldmr_results if r.success]
@@ -325,10 +299,7 @@ class Visualizer:
         ax3.set_title('Distribution of Computed Paths', fontweight='bold')
         ax3.set_ylabel('Number of Traffic Demands')
 
-        for bar, count in zip(bars3, counts):
-            height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width() / 2., height,
-                     f'{count}', ha='center', va='bottom')
+        ax3.bar_label(bars3)
 
         # 4. 计算时间分布
         comp_times = [r.computation_time * 1000 for r in ldmr_results]  # 转换为ms
@@ -524,7 +495,7 @@ class Visualizer:
                     # 归一化指标 (0-1范围)
                     values = [
                         metrics.get('success_rate', 0),
-                        1 - min(metrics.get('avg_path_delay', 0), 0.1) / 0.1,  # 延迟越低越好
+                        1 - min(metrics.get('avg_path_delay', 0), 100) / 100,  # 延迟越低越好 (ms)
                         min(metrics.get('avg_paths_per_demand', 0), 4) / 4,  # 路径数
                         1 - min(metrics.get('execution_time', 0), 10) / 10  # 执行时间越低越好
                     ]
@@ -656,14 +627,19 @@ def generate_all_visualizations(ldmr_results: List[MultiPathResult] = None,
                                 benchmark_results: Dict[str, Any] = None,
                                 param_results: Dict[str, Any] = None,
                                 output_dir: str = "results",
-                                figure_format: str = "png") -> Dict[str, str]:
+                                figure_format: str = "png",
+                                timestamp: str = None) -> Dict[str, str]:
     """
     一次性生成所有可视化图表的便捷函数
 
+    Args:
+        timestamp: 文件名时间戳，调用方可传入与数据文件共用的同一时间戳
+
     Returns:
         Dict[str, str]: 各个图表文件的路径
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     visualizer = Visualizer(output_dir, figure_format)
 
     visualization_files = {}
@@ -757,9 +733,7 @@ class AdvancedVisualizer(Visualizer):
 
         # Jain公平性指数计算和显示
         if usage_values:
-            sum_usage = sum(usage_values)
-            sum_square_usage = sum(u ** 2 for u in usage_values)
-            jain_index = (sum_usage ** 2) / (len(usage_values) * sum_square_usage) if sum_square_usage > 0 else 0
+            jain_index = jain_fairness_index(usage_values)
 
             # 绘制公平性指标
             metrics = ['Jain Fairness Index', 'Usage Variance', 'Max/Min Ratio']
@@ -773,10 +747,7 @@ class AdvancedVisualizer(Visualizer):
             ax2.set_title('Load Balancing Metrics', fontweight='bold')
             ax2.set_ylabel('Metric Value')
 
-            for bar, value in zip(bars, values):
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width() / 2., height,
-                         f'{value:.3f}', ha='center', va='bottom')
+            ax2.bar_label(bars, fmt='%.3f')
 
         plt.suptitle('Network Load Balancing Analysis', fontsize=16, fontweight='bold')
 
@@ -799,7 +770,7 @@ if __name__ == "__main__":
         'LDMR': {
             'metrics': {
                 'success_rate': 1.0,
-                'avg_path_delay': 0.072,
+                'avg_path_delay': 72.0,
                 'avg_paths_per_demand': 2.0,
                 'execution_time': 2.24
             }
@@ -807,7 +778,7 @@ if __name__ == "__main__":
         'SPF': {
             'metrics': {
                 'success_rate': 1.0,
-                'avg_path_delay': 0.076,
+                'avg_path_delay': 76.0,
                 'avg_paths_per_demand': 1.0,
                 'execution_time': 0.45
             }
@@ -815,7 +786,7 @@ if __name__ == "__main__":
         'ECMP': {
             'metrics': {
                 'success_rate': 1.0,
-                'avg_path_delay': 0.074,
+                'avg_path_delay': 74.0,
                 'avg_paths_per_demand': 3.2,
                 'execution_time': 1.12
             }
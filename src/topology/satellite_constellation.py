@@ -9,6 +9,8 @@ from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from .topology_base import NetworkTopology, Node, Link, Position, NodeType, TopologyManager
 
+SPEED_OF_LIGHT = 299.792458  # km/ms
+
 
 @dataclass
 class ConstellationConfig:
@@ -118,8 +120,7 @@ class SatelliteConstellation:
     def calculate_link_delay(self, pos1: Position, pos2: Position) -> float:
         """计算链路传播延迟（ms）"""
         distance = pos1.distance_to(pos2)  # km
-        speed_of_light = 299792.458  # km/ms
-        return distance / speed_of_light
+        return distance / SPEED_OF_LIGHT
 
     def should_create_link(self, sat1: Node, sat2: Node, max_distance: float = 8000) -> bool:
         """判断两颗卫星是否应该建立链路"""
@@ -309,7 +310,7 @@ class GroundStationManager:
                 for i in range(num_connections):
                     sat = visible_sats[i]
                     distance = gs.position.distance_to(sat.position)
-                    delay = distance / 299792.458  # km/ms
+                    delay = distance / SPEED_OF_LIGHT
 
                     link = Link(gs.id, sat.id, bandwidth, delay)
                     links.append(link)
@@ -353,6 +354,10 @@ class LEONetworkBuilder:
         for link in ground_links:
             topology.add_link(link)
 
+        # 地面站ID列表在构建时直接确定（与节点插入顺序一致），随拓扑缓存一同保存，
+        # 之后读取 topology.ground_station_ids 无需再扫描节点
+        topology._ground_station_ids = tuple(gs.id for gs in ground_stations)
+
         return topology
 
     def build_time_series(self, duration: float = 600, time_step: float = 60,
@@ -114,13 +114,26 @@ class NetworkTopology:
         self.graph = nx.Graph()  # NetworkX图对象
         self._adjacency_matrix = None
         self._weight_matrix = None
+        self._csr_structure = None
+        self._ground_station_ids = None
 
     def add_node(self, node: Node):
         """添加节点"""
         self.nodes[node.id] = node
         self.graph.add_node(node.id, node_type=node.type, position=node.position)
+        self._ground_station_ids = None
         self._invalidate_matrices()
 
+    @property
+    def ground_station_ids(self) -> Tuple[str, ...]:
+        """地面站节点ID（首次访问时计算，添加节点后重新计算；元组，调用方不能修改缓存）"""
+        if self._ground_station_ids is None:
+            self._ground_station_ids = tuple(
+                node.id for node in self.nodes.values()
+                if node.type is NodeType.GROUND_STATION
+            )
+        return self._ground_station_ids
+
     def add_link(self, link: Link):
         """添加链路"""
         if link.node1_id not in self.nodes or link.node2_id not in self.nodes:
@@ -173,6 +186,7 @@ class NetworkTopology:
         """使缓存的矩阵失效"""
         self._adjacency_matrix = None
         self._weight_matrix = None
+        self._csr_structure = None
 
     def get_adjacency_matrix(self) -> np.ndarray:
         """获取邻接矩阵"""
@@ -207,6 +221,32 @@ class NetworkTopology:
 
         return self._weight_matrix.copy()
 
+    def get_csr_structure(self) -> Tuple[List[str], Dict[str, int], np.ndarray, np.ndarray, List[Link]]:
+        """
+        获取CSR形式的邻接结构（只缓存结构，权重由调用方按需从链路对象读取）
+
+        Returns:
+            (节点ID列表, 节点ID->下标, indptr, indices, 每条有向边对应的链路对象)
+        """
+        if self._csr_structure is None:
+            node_ids = list(self.nodes.keys())
+            node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+            links = list(self.links.values())
+
+            # 每条无向链路展开为两条有向边，再按源节点稳定排序
+            ends1 = np.fromiter((node_index[link.node1_id] for link in links), dtype=np.int64, count=len(links))
+            ends2 = np.fromiter((node_index[link.node2_id] for link in links), dtype=np.int64, count=len(links))
+            sources = np.concatenate([ends1, ends2])
+            order = np.argsort(sources, kind='stable')
+            indices = np.concatenate([ends2, ends1])[order]
+            indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(sources, minlength=len(node_ids)), out=indptr[1:])
+            edge_links = [links[k % len(links)] for k in order.tolist()] if links else []
+
+            self._csr_structure = (node_ids, node_index, indptr, indices, edge_links)
+
+        return self._csr_structure
+
     def update_link_weights(self, weight_updates: Dict[Tuple[str, str], float]):
         """批量更新链路权重"""
         for link_id, new_weight in weight_updates.items():
@@ -226,13 +266,13 @@ class NetworkTopology:
 
     def get_statistics(self) -> Dict:
         """获取拓扑统计信息"""
-        satellites = [n for n in self.nodes.values() if n.type == NodeType.SATELLITE]
-        ground_stations = [n for n in self.nodes.values() if n.type == NodeType.GROUND_STATION]
+        # 节点只有卫星和地面站两类，地面站数取自缓存的 ground_station_ids，不再遍历节点
+        num_ground_stations = len(self.ground_station_ids)
 
         return {
             'total_nodes': len(self.nodes),
-            'satellites': len(satellites),
-            'ground_stations': len(ground_stations),
+            'satellites': len(self.nodes) - num_ground_stations,
+            'ground_stations': num_ground_stations,
             'total_links': len(self.links),
             'average_degree': 2 * len(self.links) / len(self.nodes) if self.nodes else 0,
             'is_connected': nx.is_connected(self.graph) if self.nodes else False
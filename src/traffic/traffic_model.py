@@ -9,6 +9,7 @@ from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 import math
+from functools import lru_cache
 
 
 @dataclass
@@ -158,7 +159,8 @@ class ParetoFlowGenerator:
     """Pareto分布流量生成器"""
 
     def __init__(self, shape_on: float = 1.5, scale_on: float = 500,
-                 shape_off: float = 1.5, scale_off: float = 1000):
+                 shape_off: float = 1.5, scale_off: float = 1000,
+                 rng: random.Random = None):
         """
         初始化Pareto流量生成器
 
@@ -167,15 +169,17 @@ class ParetoFlowGenerator:
             scale_on: on-time的尺度参数 (ms)
             shape_off: off-time的形状参数
             scale_off: off-time的尺度参数 (ms)
+            rng: 随机数生成器，默认使用全局 random 模块
         """
         self.shape_on = shape_on
         self.scale_on = scale_on
         self.shape_off = shape_off
         self.scale_off = scale_off
+        self.rng = rng or random
 
     def generate_pareto_sample(self, shape: float, scale: float) -> float:
         """生成Pareto分布样本"""
-        u = random.random()
+        u = self.rng.random()
         return scale * ((1 - u) ** (-1 / shape) - 1)
 
     def generate_on_time(self) -> float:
@@ -212,7 +216,7 @@ class ParetoFlowGenerator:
             # 生成on-time和带宽
             on_time = self.generate_on_time()
             # 带宽在平均值附近变化
-            bandwidth = avg_bandwidth * random.uniform(0.5, 1.5)
+            bandwidth = avg_bandwidth * self.rng.uniform(0.5, 1.5)
 
             if current_time + on_time <= duration:
                 flows.append((current_time, on_time, bandwidth))
@@ -225,15 +229,18 @@ class ParetoFlowGenerator:
 class TrafficGenerator:
     """综合流量生成器"""
 
-    def __init__(self, gs_zone_mapping: Dict[str, int] = None):
+    def __init__(self, gs_zone_mapping: Dict[str, int] = None, seed: Optional[int] = None):
         """
         初始化流量生成器
 
         Args:
             gs_zone_mapping: 地面站ID到区域ID的映射
+            seed: 随机种子，给定时使用独立的随机数生成器，结果可复现；
+                  为None时使用全局 random 模块，每次生成不同的流量
         """
         self.traffic_matrix = TrafficMatrix()
-        self.pareto_generator = ParetoFlowGenerator()
+        self.pareto_generator = ParetoFlowGenerator(
+            rng=random.Random(seed) if seed is not None else None)
         self.gs_zone_mapping = gs_zone_mapping or {}
         self.elephant_threshold = 50.0  # Mbps，超过此值的流量为大象流
 
@@ -351,6 +358,68 @@ class TrafficGenerator:
         }
 
 
+# 流量需求的结构化数组(SoA)布局：源/目的为节点ID表中的下标
+DEMAND_DTYPE = np.dtype([
+    ('src', '<i4'),
+    ('dst', '<i4'),
+    ('bandwidth', '<f8'),
+    ('start_time', '<f8'),
+    ('duration', '<f8'),
+    ('priority', '<i1'),
+])
+
+
+def demands_to_array(demands: List[TrafficDemand]) -> Tuple[np.ndarray, List[str]]:
+    """
+    将流量需求列表打包为结构化数组，用于跨进程传递或批量数值处理
+
+    Returns:
+        (array, node_ids): DEMAND_DTYPE 数组和下标对应的节点ID表
+    """
+    node_index: Dict[str, int] = {}
+    records = [
+        (node_index.setdefault(demand.source_id, len(node_index)),
+         node_index.setdefault(demand.destination_id, len(node_index)),
+         demand.bandwidth, demand.start_time, demand.duration, demand.priority)
+        for demand in demands
+    ]
+    return np.array(records, dtype=DEMAND_DTYPE), list(node_index)
+
+
+def demands_from_array(array: np.ndarray, node_ids: List[str]) -> List[TrafficDemand]:
+    """由 demands_to_array 的结果还原流量需求列表（顺序不变）"""
+    return [
+        TrafficDemand(node_ids[src], node_ids[dst], bandwidth, start_time, duration, priority)
+        for src, dst, bandwidth, start_time, duration, priority in array.tolist()
+    ]
+
+
+@lru_cache(maxsize=32)
+def _generate_seeded_demands(ground_station_ids: Tuple[str, ...], total_traffic: float,
+                             duration: float, elephant_ratio: float,
+                             seed: int) -> Tuple[TrafficDemand, ...]:
+    """固定种子的流量生成结果只与参数有关，按参数缓存"""
+    generator = TrafficGenerator(seed=seed)
+    return tuple(generator.generate_traffic_demands(
+        list(ground_station_ids), total_traffic, duration, elephant_ratio))
+
+
+def generate_demands(ground_station_ids: List[str], total_traffic: float = 8.0,
+                     duration: float = 300.0, elephant_ratio: float = 0.3,
+                     seed: Optional[int] = None) -> List[TrafficDemand]:
+    """
+    生成流量需求的便捷函数
+
+    给定种子时结果可复现，同一进程内相同参数只生成一次（返回新列表，
+    需求对象共享，调用方不应修改）；未给定种子时每次重新生成
+    """
+    if seed is None:
+        return TrafficGenerator().generate_traffic_demands(
+            ground_station_ids, total_traffic, duration, elephant_ratio)
+    return list(_generate_seeded_demands(tuple(ground_station_ids), total_traffic,
+                                         duration, elephant_ratio, seed))
+
+
 def create_test_traffic(ground_station_ids: List[str] = None) -> List[TrafficDemand]:
     """创建测试流量"""
     if ground_station_ids is None:
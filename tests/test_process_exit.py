@@ -0,0 +1,52 @@
+"""
+多核环境下脚本能否正常退出的回归检查
+
+以 os.cpu_count()=4 运行 benchmark.py / param_analysis.py，使其创建进程池；
+导入时编译并启动numba线程层的内核会让fork出的进程池在解释器退出时挂起
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 模拟4核机器后以 __main__ 身份运行脚本
+_RUNNER = """
+import os, runpy, sys
+os.cpu_count = lambda: 4
+sys.argv = [sys.argv[1], '--quiet']
+runpy.run_path(sys.argv[0], run_name='__main__')
+"""
+
+
+class TestProcessExit(unittest.TestCase):
+    TIMEOUT = 300
+
+    def _run_script(self, script):
+        """在临时目录中运行脚本（结果文件不写入项目目录），返回退出码"""
+        with tempfile.TemporaryDirectory() as workdir:
+            env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+            # 脚本按相对路径读取 config/，在临时目录中建立链接
+            os.symlink(PROJECT_ROOT / 'config', Path(workdir) / 'config')
+            proc = subprocess.run(
+                [sys.executable, '-c', _RUNNER, str(PROJECT_ROOT / script)],
+                cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                timeout=self.TIMEOUT
+            )
+        return proc.returncode, proc.stderr.decode('utf-8', 'replace')
+
+    def test_benchmark_exits(self):
+        returncode, stderr = self._run_script('benchmark.py')
+        self.assertEqual(returncode, 0, stderr)
+
+    def test_param_analysis_exits(self):
+        returncode, stderr = self._run_script('param_analysis.py')
+        self.assertEqual(returncode, 0, stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -59,7 +59,7 @@ def draw_topology_with_paths(
 
     graph = topology.graph
     satellite_nodes = [node.id for node in topology.nodes.values() if node.type == NodeType.SATELLITE]
-    ground_station_nodes = [node.id for node in topology.nodes.values() if node.type == NodeType.GROUND_STATION]
+    ground_station_nodes = topology.ground_station_ids
 
     # --- 绘制基础网络 ---
     # 绘制所有链路 (默认样式: 灰色，细线)
@@ -139,7 +139,7 @@ def visualize_single_demand_flow():
     topology = builder.build_network()
 
     # 选择一个有代表性的流量需求（例如，纽约到伦敦）
-    gs_nodes = [node for node in topology.nodes.values() if node.type == NodeType.GROUND_STATION]
+    gs_nodes = [topology.nodes[gs_id] for gs_id in topology.ground_station_ids]
     source_node_id = next((gs.id for gs in gs_nodes if gs.attributes.get('city') == 'New_York'), gs_nodes[0].id)
     dest_node_id = next((gs.id for gs in gs_nodes if gs.attributes.get('city') == 'London'), gs_nodes[1].id)
     demand = TrafficDemand(source_node_id, dest_node_id, 100, 0, 10)
@@ -213,10 +213,7 @@ def visualize_load_balancing():
     topology = builder.build_network()
 
     generator = TrafficGenerator()
-    ground_stations = [
-        node.id for node in topology.nodes.values()
-        if node.type.value == 'ground_station'
-    ]
+    ground_stations = topology.ground_station_ids
     demands = generator.generate_traffic_demands(
         ground_station_ids=ground_stations,
         total_traffic=config['traffic']['total_gbps'],
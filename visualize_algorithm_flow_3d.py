@@ -112,7 +112,7 @@ def visualize_single_demand_flow_3d():
     builder = LEONetworkBuilder('globalstar', 15)
     topology = builder.build_network()
 
-    gs_nodes = [node for node in topology.nodes.values() if node.type == NodeType.GROUND_STATION]
+    gs_nodes = [topology.nodes[gs_id] for gs_id in topology.ground_station_ids]
 
     # *** BUG修复开始 ***
     # 修正了NameError，将 'in' 改为 'if'
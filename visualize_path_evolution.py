@@ -131,7 +131,7 @@ def generate_path_evolution_frames():
     # --- 3. 设定固定的流量需求 ---
     # 我们将在所有时间点上，为同一对GS计算路径
     initial_topology = topology_manager.get_snapshot_at_time(0).topology
-    gs_nodes = [node for node in initial_topology.nodes.values() if node.type == NodeType.GROUND_STATION]
+    gs_nodes = [initial_topology.nodes[gs_id] for gs_id in initial_topology.ground_station_ids]
     source_node_id = next((gs.id for gs in gs_nodes if gs.attributes.get('city') == 'New_York'), gs_nodes[0].id)
     dest_node_id = next((gs.id for gs in gs_nodes if gs.attributes.get('city') == 'London'), gs_nodes[1].id)
     demand = TrafficDemand(source_node_id, dest_node_id, 100, 0, SIMULATION_DURATION)
@@ -53,7 +53,7 @@ def visualize_topology(constellation_type: str = 'globalstar', num_ground_statio
 
     # 将节点按类型（卫星/地面站）分类
     satellite_nodes = [node.id for node in topology.nodes.values() if node.type == NodeType.SATELLITE]
-    ground_station_nodes = [node.id for node in topology.nodes.values() if node.type == NodeType.GROUND_STATION]
+    ground_station_nodes = topology.ground_station_ids
 
     # --- 关键步骤 5: 使用Matplotlib和NetworkX进行绘图 ---
     plt.style.use('seaborn-v0_8-darkgrid')